@@ -4,46 +4,132 @@ from flask_sock import Sock
 app = Flask(__name__)
 sock = Sock(app)
 
-import json
-import hashlib
+import base64
+import dataclasses
+import io
+import math
 import strawberry
-from typing import List, Optional
+from typing import AsyncGenerator, List, Optional
+from strawberry.extensions import QueryDepthLimiter
 from strawberry.flask.views import GraphQLView
-
-
-def make_etag(obj) -> str:
-    """Generate a simple ETag from a Python object and hash it please."""
-    raw = json.dumps(obj, sort_keys=True).encode("utf-8")
-    return '"' + hashlib.md5(raw).hexdigest() + '"'
-
-
-# simple in-memory store
-city_services = []
-next_id = 1
-
-# track connected WebSocket clients
-ws_clients = []
+from strawberry.types import ExecutionResult
+from graphql import GraphQLError
+
+from app import config
+from app.cache.backends import MISSING, LRUCache
+from app.events.broadcaster import Broadcaster
+from app.gql.limits import QueryComplexityLimiter
+from app.gql.loaders import ServiceLoader
+from app.gql.persisted import DocumentCache, PersistedQueries, PersistedQueryError, result_cache_key
+from app.gql.ws import GRAPHQL_TRANSPORT_WS_PROTOCOL, GraphQLTransportWSSession
+from app.ndjson import NDJSON_MEDIA_TYPE, ImportReport, parse_lines
+from app.store.base import ServiceStore
+from app.store.memory import InMemoryServiceStore
+
+
+def build_service_store() -> ServiceStore:
+    # SERVICE_STORE=sql keeps services in SQLite so several workers can share them
+    if config.SERVICE_STORE == "sql":
+        from app.db.init_db import init_db
+        from app.db.session import ReadSessionLocal, SessionLocal
+        from app.store.sql import SqlServiceStore
+
+        init_db()
+        return SqlServiceStore(SessionLocal, ReadSessionLocal)
+    if config.SERVICE_STORE == "memory":
+        return InMemoryServiceStore()
+    raise ValueError(f"Unknown SERVICE_STORE: {config.SERVICE_STORE}")
+
+
+# service store (in-memory by default), indexed by id and name
+city_services = build_service_store()
+
+# max page size for GET /api/v1/city_services?limit=
+MAX_PAGE_LIMIT = 1000
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match check (weak comparison, handles lists and '*')."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+# fans service events out to connected WebSocket clients
+broadcaster = Broadcaster(
+    queue_size=config.WS_QUEUE_SIZE,
+    policy=config.WS_SLOW_CONSUMER_POLICY,
+)
 
 
 # WebSocket endpoint
 @sock.route('/ws/services')
 def services_ws(ws):
-    ws_clients.append(ws)
+    client = broadcaster.subscribe()
     try:
-        while True:
-            msg = ws.receive()
-            if msg is None:
-                break
+        # Each connection sends from its own queue, so a slow socket
+        # only delays itself. Leaves when the broadcaster drops us
+        # (slow-consumer policy) or the socket closes.
+        while not client.closed:
+            message = client.get(timeout=1.0)
+            if message is not None:
+                ws.send(message)
+
+            # Clients don't send us anything useful; drain it so it can't pile up.
+            # Raises ConnectionClosed once the peer is gone.
+            while ws.receive(timeout=0) is not None:
+                pass
     finally:
-        if ws in ws_clients:
-            ws_clients.remove(ws)
+        broadcaster.unsubscribe(client)
 
 
 # ---------------- REST ENDPOINTS ----------------
 
 @app.route('/api/v1/city_services', methods=['GET'])
 def get_services():
-    return jsonify(city_services), 200
+    # Optional query params:
+    #   cursor=<id>  -> only services after this id (use X-Next-Cursor from the last page)
+    #   limit=<n>    -> page size (1..MAX_PAGE_LIMIT); without it, everything is returned
+    #   type=<type>  -> only services of this type
+    try:
+        try:
+            cursor = int(request.args.get("cursor", 0))
+            limit = request.args.get("limit")
+            limit = int(limit) if limit is not None else None
+        except ValueError:
+            return jsonify({"error": "cursor and limit must be integers"}), 400
+        service_type = request.args.get("type")
+
+        if cursor < 0:
+            return jsonify({"error": "cursor must be a non-negative integer"}), 400
+        if limit is not None and not 1 <= limit <= MAX_PAGE_LIMIT:
+            return jsonify({"error": f"limit must be between 1 and {MAX_PAGE_LIMIT}"}), 400
+
+        # The collection ETag only depends on the store version,
+        # so an unchanged catalog gets a 304 without building any JSON.
+        headers = {"ETag": city_services.etag, "Cache-Control": "no-cache"}
+        if etag_matches(request.headers.get("If-None-Match"), headers["ETag"]):
+            return ("", 304, headers)
+
+        page = city_services.encoded_page(cursor, limit, service_type)
+        headers["ETag"] = page.etag
+        if page.next_cursor is not None:
+            headers["X-Next-Cursor"] = str(page.next_cursor)
+
+        return app.response_class(page.body, status=200, headers=headers, mimetype="application/json")
+
+    except Exception as e:
+        print("get_services error:", repr(e))
+        return jsonify({"error": "Internal Error"}), 500
 
 
 @app.route('/api/v1/city_services/<string:service_name>', methods=['GET'])
@@ -53,19 +139,14 @@ def get_service(service_name):
         if not service_name or not isinstance(service_name, str):
             return jsonify({"error": "Invalid service name"}), 400
 
-        
-        service = None
-        for s in city_services:
-            if s.get("name") == service_name:
-                service = s
-                break
+        record = city_services.get_by_name(service_name)
 
         # Not found
-        if not service:
+        if record is None:
             return jsonify({'error': 'Service not found'}), 404
 
-        # Generate ETag from the service object
-        etag = make_etag(service)
+        # Encoded body + ETag are cached on the record (rebuilt only after a PUT)
+        body, etag = record.encoded()
 
         # Read client's conditional header, if any
         client_etag = request.headers.get("If-None-Match")
@@ -77,14 +158,11 @@ def get_service(service_name):
         }
 
         # If the client's ETag matches, return 304 Not Modified
-        if client_etag == etag:
+        if etag_matches(client_etag, etag):
             return ("", 304, headers)
 
-        # Otherwise return full resource
-        response = jsonify(service)
-        for k, v in headers.items():
-            response.headers[k] = v
-        return response, 200
+        # Otherwise return full resource, already encoded
+        return app.response_class(body, status=200, headers=headers, mimetype="application/json")
 
     except KeyError as e:
         return jsonify({"error": f"missing field: {str(e)}"}), 400
@@ -100,32 +178,10 @@ def create_service():
         if not data.get('name'):
             return jsonify({'error': 'Service name required'}), 400
 
-        global next_id
-        services = {
-            'id': next_id,
-            'name': data.get('name'),
-            'type': data.get('type')
-        }
-
-        city_services.append(services)
-        next_id += 1
+        services = city_services.create(data.get('name'), data.get('type')).to_dict()
 
-        # WEBSOCKET BROADCAST HERE ---
-        try:
-            message = json.dumps({
-                "event": "service.created",
-                "data": services
-            })
-            for ws in list(ws_clients):
-                try:
-                    ws.send(message)
-                except Exception:
-                    if ws in ws_clients:
-                        ws_clients.remove(ws)
-        except Exception as e:
-            # optional: print or log, but don't fail the request because of WS
-            print("WebSocket broadcast error:", repr(e))
-        # END WEBSOCKET PART ---
+        # queued for the WebSocket dispatcher; never blocks on sockets
+        broadcaster.publish("service.created", services)
 
         return jsonify(services), 201
 
@@ -142,15 +198,14 @@ def update_service(service_id):
     try:
         data = request.get_json(force=False, silent=True) or {}
 
-        for service in city_services:
-            if service['id'] == service_id:
-                # update only provided fields
-                for k in ('name', 'type'):
-                    if k in data:
-                        service[k] = data[k]
-                return jsonify(service), 200
+        # update only provided fields
+        fields = {k: data[k] for k in ('name', 'type') if k in data}
+        service = city_services.update(service_id, fields)
+        if service is not None:
+            service = service.to_dict()
+            broadcaster.publish("service.updated", service)
+            return jsonify(service), 200
 
-        
         return jsonify({'error': 'Service not found'}), 404
 
     except KeyError as e:
@@ -164,10 +219,11 @@ def update_service(service_id):
 @app.route('/api/v1/city_services/<int:service_id>', methods=['DELETE'])
 def delete_service(service_id):
     try:
-        for service in city_services:
-            if service['id'] == service_id:
-                city_services.remove(service)
-                return '', 204
+        record = city_services.get_by_id(service_id)
+        if city_services.delete(service_id):
+            # type lets GraphQL serviceDeleted(type:) subscribers filter
+            broadcaster.publish("service.deleted", {"id": service_id, "type": record.type if record else None})
+            return '', 204
 
         return jsonify({'error': 'Service not found'}), 404
 
@@ -177,6 +233,70 @@ def delete_service(service_id):
         return jsonify({"error": "Internal Error"}), 500
 
 
+# ---------------- BULK (NDJSON) ----------------
+
+@app.route('/api/v1/city_services:bulk', methods=['POST'])
+def import_services():
+    # Body: one JSON object per line, e.g. {"name": "Water", "type": "Utility"}
+    # Lines are parsed as they stream in and inserted in batches;
+    # bad lines are reported by line number and skipped.
+    try:
+        report = ImportReport()
+        batch = []
+
+        def flush():
+            records = city_services.create_many(batch)
+            report.created += len(records)
+            broadcaster.publish("service.bulk_created", {
+                "count": len(records),
+                "first_id": records[0].id,
+                "last_id": records[-1].id,
+            })
+            batch.clear()
+
+        # request.stream is unbuffered; reading lines from it directly
+        # costs a call per byte, so put a 64 KiB buffer in front
+        for line_no, obj, error in parse_lines(io.BufferedReader(request.stream, 64 * 1024)):
+            if error is not None:
+                report.add_error(line_no, error)
+                continue
+
+            name, service_type = obj.get("name"), obj.get("type")
+            if not name or not isinstance(name, str):
+                report.add_error(line_no, "Service name required")
+                continue
+            if service_type is not None and not isinstance(service_type, str):
+                report.add_error(line_no, "type must be a string")
+                continue
+
+            batch.append((name, service_type))
+            if len(batch) >= config.BULK_BATCH_SIZE:
+                flush()
+
+        if batch:
+            flush()
+
+        return jsonify(report.to_dict()), 200
+
+    except Exception as e:
+        print("import_services error:", repr(e))
+        return jsonify({"error": "Internal Error"}), 500
+
+
+@app.route('/api/v1/city_services:bulk', methods=['GET'])
+def export_services():
+    # Streams every service as NDJSON, one page at a time,
+    # so memory stays flat however large the store is.
+    def generate():
+        cursor = 0
+        while cursor is not None:
+            records, cursor = city_services.page(cursor, config.BULK_BATCH_SIZE)
+            if records:
+                yield b"".join(r.encoded()[0] + b"\n" for r in records)
+
+    return app.response_class(generate(), status=200, mimetype=NDJSON_MEDIA_TYPE)
+
+
 # ---------------- GRAPHQL ----------------
 
 @strawberry.type
@@ -194,31 +314,214 @@ def dict_to_service(d: dict) -> Service:
     )
 
 
+def record_to_service(record) -> Service:
+    return Service(id=record.id, name=record.name, type=record.type)
+
+
+# Relay-style connection types for servicesConnection
+@strawberry.type
+class PageInfo:
+    has_next_page: bool
+    end_cursor: Optional[str]
+
+
+@strawberry.type
+class ServiceEdge:
+    cursor: str
+    node: Service
+
+
+@strawberry.type
+class ServiceConnection:
+    edges: List[ServiceEdge]
+    page_info: PageInfo
+
+
+def encode_cursor(service_id: int) -> str:
+    # Opaque to clients; it's the store's id cursor underneath
+    return base64.urlsafe_b64encode(f"service:{service_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    try:
+        kind, _, value = base64.urlsafe_b64decode(cursor.encode()).decode().partition(":")
+        if kind == "service":
+            return int(value)
+    except (ValueError, UnicodeDecodeError):
+        pass
+    raise ValueError("Invalid cursor")
+
+
 @strawberry.type
 class Query:
     @strawberry.field
-    def services(self) -> List[Service]:
-        return [dict_to_service(s) for s in city_services]
+    def services(self, type: Optional[str] = None) -> List[Service]:
+        # Everything in one list; use servicesConnection to page through large catalogs
+        records, _ = city_services.page(type=type)
+        return [record_to_service(r) for r in records]
 
     @strawberry.field
-    def service(self, id: int) -> Optional[Service]:
-        for s in city_services:
-            if s["id"] == id:
-                return dict_to_service(s)
-        return None
+    def services_connection(
+        self,
+        info: strawberry.Info,
+        first: int = config.GRAPHQL_PAGE_DEFAULT,
+        after: Optional[str] = None,
+        type: Optional[str] = None,
+    ) -> ServiceConnection:
+        if not 1 <= first <= config.GRAPHQL_PAGE_MAX:
+            raise ValueError(f"first must be between 1 and {config.GRAPHQL_PAGE_MAX}")
+        cursor = decode_cursor(after) if after else 0
+
+        records, next_cursor = city_services.page(cursor, first, type)
+
+        loader = info.context["service_loader"]
+        for record in records:
+            loader.prime(record)
+
+        edges = [ServiceEdge(cursor=encode_cursor(r.id), node=record_to_service(r)) for r in records]
+        return ServiceConnection(
+            edges=edges,
+            page_info=PageInfo(
+                has_next_page=next_cursor is not None,
+                end_cursor=edges[-1].cursor if edges else None,
+            ),
+        )
 
+    @strawberry.field
+    def service(self, info: strawberry.Info, id: int) -> Optional[Service]:
+        # Batched: aliased service(id:) fields are fetched in one store call
+        record = info.context["service_loader"].load(id, info)
+        if record is None:
+            return None
+        return record_to_service(record)
+
+
+async def service_events(event: str, service_type: Optional[str]):
+    # Data of each `event` from the broadcaster, optionally only for one type.
+    # Ends when the broadcaster drops this subscriber (slow-consumer policy).
+    sub = broadcaster.subscribe_async(events=(event,))
+    try:
+        while True:
+            item = await sub.get()
+            if item is None:
+                return
+            data = item[1]
+            if service_type is None or data.get("type") == service_type:
+                yield data
+    finally:
+        broadcaster.unsubscribe(sub)
+
+
+@strawberry.type
+class Subscription:
+    # Pushed from the same broadcaster as /ws/services (served on /api/v1/graphql/ws)
+
+    @strawberry.subscription
+    async def service_created(self, type: Optional[str] = None) -> AsyncGenerator[Service, None]:
+        async for data in service_events("service.created", type):
+            yield dict_to_service(data)
+
+    @strawberry.subscription
+    async def service_updated(self, type: Optional[str] = None) -> AsyncGenerator[Service, None]:
+        async for data in service_events("service.updated", type):
+            yield dict_to_service(data)
+
+    @strawberry.subscription
+    async def service_deleted(self, type: Optional[str] = None) -> AsyncGenerator[int, None]:
+        # id of the deleted service
+        async for data in service_events("service.deleted", type):
+            yield data["id"]
+
+
+# Shared across requests (see app/gql/persisted.py)
+persisted_queries = PersistedQueries(maxsize=config.GRAPHQL_PERSISTED_QUERIES_SIZE)
+graphql_documents = LRUCache(maxsize=config.GRAPHQL_DOCUMENT_CACHE_SIZE, ttl=math.inf)
+graphql_results = (
+    LRUCache(maxsize=config.GRAPHQL_RESULT_CACHE_SIZE, ttl=config.GRAPHQL_RESULT_CACHE_TTL)
+    if config.GRAPHQL_RESULT_CACHE_SIZE > 0 else None
+)
+
+schema = strawberry.Schema(
+    query=Query,
+    subscription=Subscription,
+    # Checked during validation, so rejected queries never run a resolver.
+    # DocumentCache comes first: a known query skips parsing and all validation rules.
+    extensions=[
+        lambda: DocumentCache(graphql_documents),
+        lambda: QueryDepthLimiter(max_depth=config.GRAPHQL_MAX_DEPTH),
+        lambda: QueryComplexityLimiter(
+            max_complexity=config.GRAPHQL_MAX_COMPLEXITY,
+            list_sizes={"services": MAX_PAGE_LIMIT},
+            default_page_size=config.GRAPHQL_PAGE_DEFAULT,
+        ),
+    ],
+)
+
+
+class ServiceGraphQLView(GraphQLView):
+    def get_context(self, request, response):
+        # A fresh loader per request, so batching/caching never leaks between requests
+        return {"request": request, "response": response, "service_loader": ServiceLoader(city_services)}
+
+    def execute_single(self, request, request_adapter, sub_response, context, root_value, request_data):
+        # Persisted queries: the client may send only the query's SHA-256
+        try:
+            query, sha = persisted_queries.resolve(request_data.query, request_data.extensions)
+        except PersistedQueryError as e:
+            return ExecutionResult(data=None, errors=[GraphQLError(str(e), extensions={"code": e.code})])
+        request_data = dataclasses.replace(request_data, query=query)
+
+        # Result cache: keyed by the store version read *before* executing,
+        # so a cached result is never newer-tagged than the data it holds.
+        # Only query operations are cached (checked on the parsed document).
+        version = key = None
+        if graphql_results is not None and sha is not None:
+            version = city_services.version
+            key = self._result_key(sha, request_data, version)
+            if key is not None:
+                cached = graphql_results.get(key)
+                if cached is not MISSING:
+                    return cached
+
+        result = super().execute_single(request, request_adapter, sub_response, context, root_value, request_data)
+
+        if version is not None and not result.errors:
+            key = key or self._result_key(sha, request_data, version)
+            if key is not None:
+                graphql_results.set(key, result)
+        return result
+
+    @staticmethod
+    def _result_key(sha, request_data, version):
+        document = graphql_documents.get(sha)
+        if document is MISSING or not document.is_query(request_data.operation_name):
+            return None
+        return result_cache_key(sha, request_data.operation_name, request_data.variables, version)
 
-schema = strawberry.Schema(query=Query)
 
 app.add_url_rule(
     "/api/v1/graphql",
-    view_func=GraphQLView.as_view(
+    view_func=ServiceGraphQLView.as_view(
         "graphql_view",
         schema=schema,
-        graphiql=True  # enables the nice web UI
+        graphql_ide="graphiql"  # enables the nice web UI
     )
 )
 
 
+def graphql_ws_context() -> dict:
+    return {"service_loader": ServiceLoader(city_services)}
+
+
+# lets GraphQL WebSocket clients negotiate their subprotocol
+app.config["SOCK_SERVER_OPTIONS"] = {"subprotocols": [GRAPHQL_TRANSPORT_WS_PROTOCOL]}
+
+
+# GraphQL subscriptions (and queries) over WebSocket, graphql-transport-ws protocol
+@sock.route('/api/v1/graphql/ws')
+def graphql_ws(ws):
+    GraphQLTransportWSSession(ws, schema, graphql_ws_context).run()
+
+
 if __name__ == '__main__':
     app.run(host="0.0.0.0", port=5000, debug=True)
@@ -2,14 +2,22 @@
 # Purpose: FastAPI entrypoint + route definitions.
 # Routes should focus on HTTP concerns and delegate business logic to services.
 
-from fastapi import FastAPI, Depends, HTTPException
-from typing import List
-
-from app.models.product import ProductCreate, Product
+from fastapi import APIRouter, FastAPI, Body, Depends, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from typing import List, Optional
+
+from app import config
+from app.models.product import ProductCreate, Product, ProductSort
+from app.ndjson import NDJSON_MEDIA_TYPE, ImportReport, aparse_lines, encode_line
 from app.services.product_service import ProductService
+from app.services.cached_product_service import CachedProductService, build_product_cache
+from app.routers.product_pages import check_cursor, json_array_chunks, next_page_headers
+from app.responses import FastJSONResponse, product_rows_to_json
 
 from sqlalchemy.orm import Session
-from app.db.deps import get_db
+from app.db.deps import get_db, get_read_db
 
 # api_fastapi.py
 # Purpose: Central logging configuration for the application.
@@ -30,10 +38,25 @@ from app.db.init_db import init_db
 init_db()
 
 
+# Shared read-through cache for product reads (None when PRODUCT_CACHE_BACKEND=none)
+product_cache = build_product_cache()
+
+
+def make_product_service(db: Session) -> ProductService:
+    if product_cache is None:
+        return ProductService(db)
+    return CachedProductService(db, product_cache)
+
+
 def get_product_service(db: Session = Depends(get_db)) -> ProductService:
     # For each request, FastAPI gives us a fresh DB session,
     # and we create a service that uses that session.
-    return ProductService(db)
+    return make_product_service(db)
+
+
+def get_read_product_service(db: Session = Depends(get_read_db)) -> ProductService:
+    # Same, but on the read-only pool; use for GET routes only
+    return make_product_service(db)
 
 
 @app.get("/health")
@@ -42,14 +65,120 @@ def health():
     return {"status": "ok"}
 
 
-@app.get("/products", response_model=List[Product])
-def get_products(service: ProductService = Depends(get_product_service)):
+@app.get("/cache/stats")
+def cache_stats():
+    # Hit/miss counters for the product read cache
+    if product_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **product_cache.stats()}
+
+
+@app.post("/products:bulk")
+async def import_products(request: Request, service: ProductService = Depends(get_product_service)):
+    # Body: NDJSON, one {"name": "..."} object per line.
+    # Lines are parsed as they stream in and inserted in batched transactions;
+    # bad lines are reported by line number and skipped.
+    report = ImportReport()
+    batch: List[str] = []
+
+    async for line_no, obj, error in aparse_lines(request.stream()):
+        if error is None:
+            try:
+                batch.append(ProductCreate.model_validate(obj).name)
+            except ValidationError as e:
+                error = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+        if error is not None:
+            report.add_error(line_no, error)
+            continue
+
+        if len(batch) >= config.BULK_BATCH_SIZE:
+            report.created += await run_in_threadpool(service.import_names, batch)
+            batch = []
+
+    if batch:
+        report.created += await run_in_threadpool(service.import_names, batch)
+
+    return report.to_dict()
+
+
+@app.get("/products:bulk")
+def export_products(service: ProductService = Depends(get_read_product_service)):
+    # Stream every product as NDJSON, one keyset page at a time (flat memory)
+    def generate():
+        for page in service.iter_pages(config.BULK_BATCH_SIZE):
+            yield b"".join(encode_line({"id": r[0], "name": r[1]}) for r in page)
+
+    return StreamingResponse(generate(), media_type=NDJSON_MEDIA_TYPE)
+
+
+def check_batch_size(items: list) -> None:
+    if len(items) > config.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch too large: {len(items)} items (max {config.BATCH_MAX_ITEMS})",
+        )
+
+
+@app.post("/products:batch", response_model=List[Product], status_code=201)
+def create_products(requests: List[ProductCreate], service: ProductService = Depends(get_product_service)):
+    # Create many products in one transaction; results keep the request order
+    check_batch_size(requests)
+    return service.create_many(requests)
+
+
+@app.put("/products:batch", response_model=List[Product])
+def update_products(items: List[Product], service: ProductService = Depends(get_product_service)):
+    # Rename many products in one transaction; ids that don't exist are left out of the result
+    check_batch_size(items)
+    return service.update_many(items)
+
+
+@app.delete("/products:batch")
+def delete_products(
+    product_ids: List[int] = Body(...),
+    service: ProductService = Depends(get_product_service),
+):
+    # Body: JSON array of ids. Returns the ids that were actually deleted.
+    check_batch_size(product_ids)
+    return {"deleted": service.delete_many(product_ids)}
+
+
+# Product CRUD routes for the default sync mode.
+# Registered at the bottom of this file; DB_MODE=async swaps in app/routers/products_async.py.
+router = APIRouter()
+
+
+@router.get("/products", response_model=List[Product])
+def get_products(
+    request: Request,
+    after_id: Optional[int] = Query(None, ge=0, description="Cursor: id of the last product on the previous page"),
+    after_name: Optional[str] = Query(None, description="Cursor for name sorts: name of the last product"),
+    limit: int = Query(config.PRODUCTS_PAGE_DEFAULT, ge=1, le=config.PRODUCTS_PAGE_MAX),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=50),
+    sort: ProductSort = ProductSort.id_asc,
+    stream: bool = Query(False, description="Stream every matching product (id order) as one JSON array"),
+    service: ProductService = Depends(get_read_product_service),
+):
     # Route (HTTP layer): calls into service (business layer)
-    return service.get_all()
+    if stream:
+        pages = service.iter_pages(config.BULK_BATCH_SIZE, name_prefix)
+        return StreamingResponse(json_array_chunks(pages), media_type="application/json")
+
+    check_cursor(sort, after_id, after_name)
+
+    # Fetch one extra row to know whether there is a next page
+    page = service.get_page(limit + 1, after_id, after_name, name_prefix, sort)
+    headers = {}
+    if len(page) > limit:
+        page = page[:limit]
+        headers = next_page_headers(request, page[-1], sort)
 
+    # (id, name) rows -> JSON bytes in one step; response_model stays for the docs only
+    return FastJSONResponse(product_rows_to_json(page), headers=headers)
 
-@app.get("/products/{product_id}", response_model=Product)
-def get_product(product_id: int, service: ProductService = Depends(get_product_service)):
+
+@router.get("/products/{product_id}", response_model=Product)
+def get_product(product_id: int, service: ProductService = Depends(get_read_product_service)):
     # Get one product; return 404 if not found
     product = service.get_by_id(product_id)
 
@@ -59,12 +188,12 @@ def get_product(product_id: int, service: ProductService = Depends(get_product_s
     return product
 
 
-@app.post("/products", response_model=Product, status_code=201)
+@router.post("/products", response_model=Product, status_code=201)
 def create_product(request: ProductCreate, service: ProductService = Depends(get_product_service)):
     # Create a product from validated request data
     return service.create(request)
 
-@app.put("/products/{product_id}", response_model=Product)
+@router.put("/products/{product_id}", response_model=Product)
 def update_product(
     product_id: int,
     request: ProductCreate,
@@ -77,7 +206,7 @@ def update_product(
     return updated
 
 
-@app.delete("/products/{product_id}", status_code=200)
+@router.delete("/products/{product_id}", status_code=200)
 def delete_product(
     product_id: int,
     service: ProductService = Depends(get_product_service),
@@ -87,4 +216,13 @@ def delete_product(
         raise HTTPException(status_code=404, detail=f"No product found with id={product_id}")
 
     # Return a friendly message (optional)
-    return {"message": f"Deleted product id={product_id}"}
\ No newline at end of file
+    return {"message": f"Deleted product id={product_id}"}
+
+
+# Pick the product CRUD routes for the configured DB mode
+if config.DB_MODE == "async":
+    from app.routers.products_async import router as products_router
+else:
+    products_router = router
+
+app.include_router(products_router)
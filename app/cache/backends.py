@@ -0,0 +1,99 @@
+# app/cache/backends.py
+# Purpose: Cache storage backends.
+#   LRUCache   -> in-process, bounded, per-entry TTL (default)
+#   RedisCache -> shared across processes/workers (optional: needs the redis package)
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+try:
+    import redis
+except ImportError:  # optional dependency
+    redis = None
+
+# Sentinel for "not in cache" (None is a valid cached value)
+MISSING = object()
+
+
+class CacheBackend:
+    def get(self, key: str) -> Any:
+        # Cached value, or MISSING
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any) -> None:
+        raise NotImplementedError
+
+    def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class LRUCache(CacheBackend):
+    def __init__(self, maxsize: int = 10_000, ttl: float = 30.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self._ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisCache(CacheBackend):
+    # Values are pickled; keys are namespaced with `prefix` so clear() only touches ours
+    def __init__(self, url: str, ttl: float = 30.0, prefix: str = "city_services:") -> None:
+        if redis is None:
+            raise RuntimeError("RedisCache needs the 'redis' package (pip install redis)")
+        self._client = redis.Redis.from_url(url)
+        self._ttl = max(1, int(ttl))
+        self._prefix = prefix
+
+    def get(self, key: str) -> Any:
+        raw: Optional[bytes] = self._client.get(self._prefix + key)
+        if raw is None:
+            return MISSING
+        return pickle.loads(raw)
+
+    def set(self, key: str, value: Any) -> None:
+        self._client.setex(self._prefix + key, self._ttl, pickle.dumps(value))
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._client.delete(*(self._prefix + k for k in keys))
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(match=self._prefix + "*"):
+            self._client.delete(key)
@@ -0,0 +1,71 @@
+# app/cache/read_through.py
+# Purpose: Read-through cache with stampede protection and hit/miss stats.
+#
+# get_or_load(key, loader):
+#   hit  -> return the cached value
+#   miss -> run loader() once per key (SingleFlight), cache and return it
+# Invalidation bumps a generation counter, so a load that started before
+# a write can't put its (now stale) result into the cache afterwards.
+
+import threading
+from typing import Any, Callable, Dict
+
+from app.cache.backends import MISSING, CacheBackend
+from app.cache.singleflight import SingleFlight
+
+
+class ReadThroughCache:
+    def __init__(self, backend: CacheBackend) -> None:
+        self.backend = backend
+        self._flight = SingleFlight()
+        self._generation = 0
+        self._gen_lock = threading.Lock()
+
+        # Plain counters, no lock on the hot path; under heavy thread
+        # contention an increment can occasionally be lost (stats only).
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+        self.coalesced = 0
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        value = self.backend.get(key)
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value, shared = self._flight.do(key, lambda: self._load(key, loader))
+        if shared:
+            self.coalesced += 1
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        with self._gen_lock:
+            self._generation += 1
+        self.backend.delete(*keys)
+
+    def clear(self) -> None:
+        with self._gen_lock:
+            self._generation += 1
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "loads": self.loads,          # actual backend (DB) reads
+            "coalesced": self.coalesced,  # misses served by another caller's load
+        }
+
+    def _load(self, key: str, loader: Callable[[], Any]) -> Any:
+        generation = self._generation
+        self.loads += 1
+        value = loader()
+
+        # None means "not found": not cached, so a later create is seen at once
+        if value is not None:
+            with self._gen_lock:
+                if generation == self._generation:
+                    self.backend.set(key, value)
+        return value
@@ -0,0 +1,85 @@
+# app/config.py
+# Purpose: Runtime settings, read once from environment variables.
+# Keep defaults dev-friendly; production overrides them via env.
+
+import os
+
+# ---------------- Database ----------------
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./city_services.db")
+
+# "sync"  -> def routes + Session (default)
+# "async" -> async def routes + AsyncSession (needs aiosqlite)
+DB_MODE = os.getenv("DB_MODE", "sync")
+
+# SQLite tuning profile (see SQLITE_PROFILES in app/db/session.py):
+#   "default"    -> SQLite's own defaults, one engine for reads and writes
+#   "production" -> WAL + tuned pragmas, and a separate read-only pool for GETs
+SQLITE_PROFILE = os.getenv("SQLITE_PROFILE", "default")
+
+# How long a connection waits on a locked database before "database is locked"
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+
+# Connection pool sizes (production profile)
+SQLITE_WRITE_POOL_SIZE = int(os.getenv("SQLITE_WRITE_POOL_SIZE", "4"))
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "16"))
+
+# ---------------- Flask city_services store ----------------
+
+# "memory" -> process-local InMemoryServiceStore (default; lost on restart)
+# "sql"    -> SqlServiceStore on DATABASE_URL, shared by every worker
+SERVICE_STORE = os.getenv("SERVICE_STORE", "memory")
+
+# ---------------- GraphQL limits (Flask /api/v1/graphql) ----------------
+
+# Deepest selection nesting accepted
+GRAPHQL_MAX_DEPTH = int(os.getenv("GRAPHQL_MAX_DEPTH", "10"))
+
+# Max estimated cost per operation (see app/gql/limits.py for the cost model)
+GRAPHQL_MAX_COMPLEXITY = int(os.getenv("GRAPHQL_MAX_COMPLEXITY", "5000"))
+
+# servicesConnection page size: default `first`, and the largest allowed
+GRAPHQL_PAGE_DEFAULT = int(os.getenv("GRAPHQL_PAGE_DEFAULT", "100"))
+GRAPHQL_PAGE_MAX = int(os.getenv("GRAPHQL_PAGE_MAX", "1000"))
+
+# Query caches: APQ hash -> query text, and parsed/validated documents per query hash
+GRAPHQL_PERSISTED_QUERIES_SIZE = int(os.getenv("GRAPHQL_PERSISTED_QUERIES_SIZE", "1000"))
+GRAPHQL_DOCUMENT_CACHE_SIZE = int(os.getenv("GRAPHQL_DOCUMENT_CACHE_SIZE", "256"))
+
+# Whole-result cache for identical query + variables at the same store version.
+# 0 turns it off (default).
+GRAPHQL_RESULT_CACHE_SIZE = int(os.getenv("GRAPHQL_RESULT_CACHE_SIZE", "0"))
+GRAPHQL_RESULT_CACHE_TTL = float(os.getenv("GRAPHQL_RESULT_CACHE_TTL", "60"))
+
+# ---------------- WebSocket broadcasting ----------------
+
+# Max messages buffered per WebSocket client before the slow-consumer policy kicks in
+WS_QUEUE_SIZE = int(os.getenv("WS_QUEUE_SIZE", "256"))
+
+# What to do when a client's queue is full:
+#   "drop_oldest" -> discard the oldest queued message and keep the client
+#   "disconnect"  -> close the client; it can reconnect and resync
+WS_SLOW_CONSUMER_POLICY = os.getenv("WS_SLOW_CONSUMER_POLICY", "drop_oldest")
+
+# ---------------- Bulk NDJSON import ----------------
+
+# Rows inserted per transaction / store lock acquisition
+BULK_BATCH_SIZE = int(os.getenv("BULK_BATCH_SIZE", "1000"))
+
+# Max items accepted by one /products:batch request
+BATCH_MAX_ITEMS = int(os.getenv("BATCH_MAX_ITEMS", "10000"))
+
+# ---------------- Product read cache ----------------
+
+# "lru"   -> in-process LRU with TTL (default)
+# "redis" -> shared across workers (needs the redis package and REDIS_URL)
+# "none"  -> no caching
+PRODUCT_CACHE_BACKEND = os.getenv("PRODUCT_CACHE_BACKEND", "lru")
+PRODUCT_CACHE_TTL = float(os.getenv("PRODUCT_CACHE_TTL", "30"))
+PRODUCT_CACHE_MAXSIZE = int(os.getenv("PRODUCT_CACHE_MAXSIZE", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+
+# ---------------- GET /products paging ----------------
+
+PRODUCTS_PAGE_DEFAULT = int(os.getenv("PRODUCTS_PAGE_DEFAULT", "100"))
+PRODUCTS_PAGE_MAX = int(os.getenv("PRODUCTS_PAGE_MAX", "1000"))
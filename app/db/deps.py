@@ -2,9 +2,11 @@
 # Purpose: Dependency that provides a DB session per request.
 # Equivalent to "scoped DbContext" lifetime in ASP.NET Core.
 
-from typing import Generator
+from typing import AsyncGenerator, Generator
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from app.db import session
+from app.db.session import ReadSessionLocal, SessionLocal
 
 def get_db() -> Generator[Session, None, None]:
     """
@@ -16,3 +18,27 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Like get_db, but from the read-only pool (production SQLite profile).
+    Use it for GET routes; in the default profile it is the same pool as get_db.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async mode (DB_MODE=async) version of get_db.
+    Yields an AsyncSession and closes it after the request completes.
+    """
+    if session.AsyncSessionLocal is None:
+        raise RuntimeError("Async DB session requested but DB_MODE is not 'async'")
+
+    async with session.AsyncSessionLocal() as db:
+        yield db
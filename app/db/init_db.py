@@ -9,3 +9,9 @@ from app.db.models import Base
 def init_db() -> None:
     # Creates tables if they do not exist
     Base.metadata.create_all(bind=engine)
+
+    # create_all skips indexes on tables that already exist,
+    # so add any index introduced after the DB file was first created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
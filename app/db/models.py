@@ -2,6 +2,8 @@
 # Purpose: SQLAlchemy ORM models (database tables).
 # Equivalent to EF Core entity classes.
 
+from typing import Optional
+
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 from sqlalchemy import Integer, String
 
@@ -17,4 +19,30 @@ class ProductDB(Base):
 
     # Columns
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
-    name: Mapped[str] = mapped_column(String(50), nullable=False)
+    # Indexed for name-prefix filtering and name-sorted keyset pagination
+    name: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+
+
+class ServiceDB(Base):
+    # City services for the Flask API (SERVICE_STORE=sql)
+    __tablename__ = "services"
+    # AUTOINCREMENT: ids are never reused after a delete, same as the in-memory store
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True, index=True)
+    # Bumped on every update of this row
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+
+
+class ServiceCollectionDB(Base):
+    # Single row holding the version of the whole services table,
+    # bumped in the same transaction as every write. Shared by all
+    # workers, so collection ETags agree across processes.
+    __tablename__ = "service_collection"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Random per-database tag, so a recreated DB never reuses old ETags
+    epoch: Mapped[str] = mapped_column(String(16), nullable=False)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
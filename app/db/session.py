@@ -1,14 +1,95 @@
 # app/db/session.py
 # Purpose: Create the SQLAlchemy engine + session factory
+#
+# The engine setup follows a tuning profile (config.SQLITE_PROFILE):
+#   default    -> plain engine, SQLite defaults (what this app always used)
+#   production -> WAL journaling and tuned pragmas on every connection,
+#                 a small write pool, and a separate read-only pool
+#                 (ReadSessionLocal) so GETs never queue behind writers
 
-from sqlalchemy import create_engine
+from typing import Dict, Optional
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
-DATABASE_URL = "sqlite:///./city_services.db"
+from app import config
+
+DATABASE_URL = config.DATABASE_URL
+
+# PRAGMAs applied to each new connection, per profile
+SQLITE_PROFILES: Dict[str, Dict[str, object]] = {
+    "default": {},
+    "production": {
+        "journal_mode": "WAL",          # readers don't block the writer (and vice versa)
+        "synchronous": "NORMAL",        # safe with WAL; fsync at checkpoints, not every commit
+        "cache_size": -64000,           # negative = KiB, so ~64 MB page cache per connection
+        "mmap_size": 268435456,         # 256 MB memory-mapped reads
+        "busy_timeout": config.SQLITE_BUSY_TIMEOUT_MS,
+        "temp_store": "MEMORY",
+    },
+}
+
+# Set on connections from the read-only pool
+READ_ONLY_PRAGMAS: Dict[str, object] = {"query_only": "ON"}
+
+# journal_mode is a property of the database file; only the writer sets it
+_WRITE_ONLY_PRAGMAS = ("journal_mode",)
+
+
+def install_pragmas(engine: Engine, pragmas: Dict[str, object]) -> None:
+    # Run the PRAGMAs on every new DBAPI connection the engine opens
+    if not pragmas:
+        return
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def build_engine(
+    url: str,
+    profile: str = "default",
+    read_only: bool = False,
+    pool_size: Optional[int] = None,
+) -> Engine:
+    """
+    Create a sync engine for `url` using a tuning profile from SQLITE_PROFILES.
+    read_only=True builds an engine for the read pool (query_only, no journal change).
+    """
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLite profile: {profile}")
+
+    pragmas = dict(SQLITE_PROFILES[profile])
+    if read_only:
+        for name in _WRITE_ONLY_PRAGMAS:
+            pragmas.pop(name, None)
+        pragmas.update(READ_ONLY_PRAGMAS)
+
+    kwargs = {}
+    if pool_size is not None:
+        kwargs = {"pool_size": pool_size, "max_overflow": pool_size, "pool_timeout": 30}
 
-engine = create_engine(
+    engine = create_engine(url, connect_args={"check_same_thread": False}, **kwargs)
+    install_pragmas(engine, pragmas)
+    return engine
+
+
+def _is_file_database(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url and url.rstrip("/") != "sqlite:"
+
+
+_production = config.SQLITE_PROFILE == "production"
+
+engine = build_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False}
+    config.SQLITE_PROFILE,
+    pool_size=config.SQLITE_WRITE_POOL_SIZE if _production else None,
 )
 
 SessionLocal = sessionmaker(
@@ -17,3 +98,39 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# Read-only engine/sessions for GET routes. Outside the production profile
+# (or for in-memory DBs, which can't be shared) reads use the main engine.
+if _production and _is_file_database(DATABASE_URL):
+    read_engine = build_engine(
+        DATABASE_URL,
+        config.SQLITE_PROFILE,
+        read_only=True,
+        pool_size=config.SQLITE_READ_POOL_SIZE,
+    )
+    ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
+
+
+def to_async_url(url: str) -> str:
+    # sqlite:///./x.db -> sqlite+aiosqlite:///./x.db
+    return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+
+
+# Async engine + session factory, only built in async mode
+# (creating the engine imports the aiosqlite driver).
+async_engine = None
+AsyncSessionLocal = None
+
+if config.DB_MODE == "async":
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    async_engine = create_async_engine(to_async_url(DATABASE_URL))
+    install_pragmas(async_engine.sync_engine, SQLITE_PROFILES[config.SQLITE_PROFILE])
+
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
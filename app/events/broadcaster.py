@@ -0,0 +1,256 @@
+# app/events/broadcaster.py
+# Purpose: Non-blocking fan-out of service events to WebSocket clients.
+#
+# publish() only drops the event on an inbox queue, so the HTTP request
+# that triggered it never waits on sockets. A background dispatcher thread
+# encodes each event once and hands it to every subscriber's bounded queue.
+# Each WebSocket handler drains its own queue, so a slow client only slows
+# itself down; when its queue is full the slow-consumer policy applies.
+#
+# Two kinds of subscriber share the same single pass per event:
+#   Subscriber      -> raw /ws/services sockets; gets the JSON string
+#                      (encoded at most once per event)
+#   AsyncSubscriber -> GraphQL subscriptions; gets (event, data) on its
+#                      asyncio loop, with no extra thread per subscriber
+# Either kind can ask for only some event names.
+
+import asyncio
+import json
+import logging
+import queue
+import threading
+from collections import deque
+from typing import FrozenSet, Iterable, Optional, Tuple
+
+logger = logging.getLogger("city_services.broadcaster")
+
+DROP_OLDEST = "drop_oldest"
+DISCONNECT = "disconnect"
+
+_STOP = object()
+
+
+class Subscriber:
+    # Receives the encoded JSON message
+    raw = False
+
+    def __init__(self, maxsize: int, policy: str, events: Optional[FrozenSet[str]] = None) -> None:
+        self._maxsize = maxsize
+        self._policy = policy
+        self.events = events  # None = every event
+        self._messages: deque = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self.closed = False
+        self.dropped = 0
+
+    def offer(self, message: str) -> bool:
+        """
+        Queue a message without blocking (called by the dispatcher).
+        Returns False if the subscriber is closed and should be removed.
+        """
+        with self._cond:
+            if self.closed:
+                return False
+
+            if len(self._messages) >= self._maxsize:
+                if self._policy == DISCONNECT:
+                    self.closed = True
+                    self._cond.notify_all()
+                    return False
+                self._messages.popleft()
+                self.dropped += 1
+
+            self._messages.append(message)
+            self._cond.notify()
+            return True
+
+    def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        # Next queued message, or None on timeout / close
+        with self._cond:
+            if not self._messages and not self.closed:
+                self._cond.wait(timeout)
+            if self._messages:
+                return self._messages.popleft()
+            return None
+
+    def close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class AsyncSubscriber:
+    """
+    Receives (event, data) tuples on an asyncio event loop.
+    offer() runs on the dispatcher thread and only schedules delivery,
+    so the dispatcher never waits on a subscriber's loop.
+    """
+    raw = True
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        maxsize: int,
+        policy: str,
+        events: Optional[FrozenSet[str]] = None,
+    ) -> None:
+        self._loop = loop
+        self._maxsize = maxsize
+        self._policy = policy
+        self.events = events
+        self._items: deque = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.dropped = 0
+
+    def offer(self, item: tuple) -> bool:
+        if self.closed:
+            return False
+        try:
+            self._loop.call_soon_threadsafe(self._deliver, item)
+        except RuntimeError:
+            # the loop is gone (connection ended without unsubscribing)
+            self.closed = True
+            return False
+        return True
+
+    async def get(self) -> Optional[tuple]:
+        # Next (event, data), or None once closed
+        while not self._items:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+    def close(self) -> None:
+        # May be called from any thread
+        self.closed = True
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            pass
+
+    def _deliver(self, item: tuple) -> None:
+        # Runs on the subscriber's loop
+        if self.closed:
+            return
+        if len(self._items) >= self._maxsize:
+            if self._policy == DISCONNECT:
+                self.closed = True
+                self._ready.set()
+                return
+            self._items.popleft()
+            self.dropped += 1
+        self._items.append(item)
+        self._ready.set()
+
+
+class Broadcaster:
+    def __init__(self, queue_size: int = 256, policy: str = DROP_OLDEST) -> None:
+        if policy not in (DROP_OLDEST, DISCONNECT):
+            raise ValueError(f"Unknown slow-consumer policy: {policy}")
+
+        self._queue_size = queue_size
+        self._policy = policy
+
+        # Copy-on-write tuple: the dispatcher reads it without locking
+        self._subscribers: Tuple[Subscriber, ...] = ()
+        self._lock = threading.Lock()
+
+        self._inbox: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, events: Optional[Iterable[str]] = None) -> Subscriber:
+        sub = Subscriber(self._queue_size, self._policy, frozenset(events) if events is not None else None)
+        self._add(sub)
+        return sub
+
+    def subscribe_async(
+        self,
+        events: Optional[Iterable[str]] = None,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+    ) -> AsyncSubscriber:
+        # Call from a coroutine; events are delivered on that (or the given) loop
+        sub = AsyncSubscriber(
+            loop or asyncio.get_running_loop(),
+            self._queue_size,
+            self._policy,
+            frozenset(events) if events is not None else None,
+        )
+        self._add(sub)
+        return sub
+
+    def _add(self, sub) -> None:
+        with self._lock:
+            self._subscribers = self._subscribers + (sub,)
+
+    def unsubscribe(self, sub) -> None:
+        sub.close()
+        with self._lock:
+            self._subscribers = tuple(s for s in self._subscribers if s is not sub)
+
+    def publish(self, event: str, data: dict) -> None:
+        # O(1) for the caller, no matter how many clients are connected
+        self._ensure_started()
+        self._inbox.put((event, data))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every event published so far has been handed to subscribers.
+        Mostly useful in tests and benchmarks.
+        """
+        self._ensure_started()
+        done = threading.Event()
+        self._inbox.put(done)
+        return done.wait(timeout)
+
+    def stop(self) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._inbox.put(_STOP)
+            thread.join()
+
+    # ---------------- dispatcher ----------------
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ws-broadcaster", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            item = self._inbox.get()
+            if item is _STOP:
+                return
+            if isinstance(item, threading.Event):
+                item.set()
+                continue
+
+            try:
+                event, data = item
+                message = None
+                for sub in self._subscribers:
+                    if sub.events is not None and event not in sub.events:
+                        continue
+                    if sub.raw:
+                        ok = sub.offer(item)
+                    else:
+                        if message is None:
+                            message = json.dumps({"event": event, "data": data})
+                        ok = sub.offer(message)
+                    if not ok:
+                        self.unsubscribe(sub)
+            except Exception:
+                # never let one bad event kill the dispatcher
+                logger.exception("WebSocket broadcast error")
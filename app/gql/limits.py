@@ -0,0 +1,95 @@
+# app/gql/limits.py
+# Purpose: Reject expensive GraphQL queries before they execute.
+#
+# Depth is handled by strawberry's QueryDepthLimiter. This module adds a
+# complexity (cost) limit, checked during validation from the query text alone:
+#   - every field costs 1
+#   - a field's children are multiplied by its page size: the `first`
+#     argument, or a fixed estimate for unbounded list fields
+#   - fragments are expanded; introspection (__*) fields are free
+# so 500 aliased service(id:) lookups, or a connection nested inside a
+# connection, add up fast and are refused with a normal GraphQL error.
+
+from typing import Dict, Optional
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    SelectionSetNode,
+    ValidationRule,
+)
+from strawberry.extensions import AddValidationRules
+
+
+def selection_cost(
+    selection_set: Optional[SelectionSetNode],
+    fragments: dict,
+    list_sizes: Dict[str, int],
+    default_page_size: int,
+    visited: frozenset = frozenset(),
+) -> int:
+    if selection_set is None:
+        return 0
+
+    cost = 0
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            name = selection.name.value
+            if name.startswith("__"):
+                continue
+            children = selection_cost(selection.selection_set, fragments, list_sizes, default_page_size, visited)
+            cost += 1 + children * field_multiplier(selection, list_sizes, default_page_size)
+        elif isinstance(selection, InlineFragmentNode):
+            cost += selection_cost(selection.selection_set, fragments, list_sizes, default_page_size, visited)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in visited or name not in fragments:
+                continue
+            cost += selection_cost(
+                fragments[name].selection_set, fragments, list_sizes, default_page_size, visited | {name}
+            )
+    return cost
+
+
+def field_multiplier(field: FieldNode, list_sizes: Dict[str, int], default_page_size: int) -> int:
+    for arg in field.arguments or ():
+        if arg.name.value == "first":
+            # Variables aren't known at validation time: assume the default page size
+            if isinstance(arg.value, IntValueNode):
+                return max(int(arg.value.value), 1)
+            return default_page_size
+    return list_sizes.get(field.name.value, 1)
+
+
+class QueryComplexityLimiter(AddValidationRules):
+    """
+    Schema extension that fails validation when an operation's estimated
+    cost is above max_complexity.
+    list_sizes: estimated item count for list fields without a `first` argument.
+    """
+
+    def __init__(
+        self,
+        max_complexity: int,
+        list_sizes: Optional[Dict[str, int]] = None,
+        default_page_size: int = 100,
+    ) -> None:
+        sizes = dict(list_sizes or {})
+
+        class QueryComplexityRule(ValidationRule):
+            def enter_operation_definition(self, node: OperationDefinitionNode, *_args) -> None:
+                fragments = {f.name.value: f for f in self.context.document.definitions
+                             if f.kind == "fragment_definition"}
+                cost = selection_cost(node.selection_set, fragments, sizes, default_page_size)
+                if cost > max_complexity:
+                    name = node.name.value if node.name else "anonymous"
+                    self.report_error(GraphQLError(
+                        f"'{name}' has complexity {cost}, above the maximum of {max_complexity}",
+                        [node],
+                    ))
+
+        super().__init__([QueryComplexityRule])
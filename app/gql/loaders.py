@@ -0,0 +1,97 @@
+# app/gql/loaders.py
+# Purpose: DataLoader-style batching for GraphQL lookups by id.
+#
+# The Flask GraphQL view executes synchronously, so resolvers run one after
+# another and there is no event loop tick to batch on. Instead, the first
+# lookup that misses looks at the whole operation, collects the id of every
+# sibling field with the same name (aliases, fragments, variables included)
+# and fetches them all with one store.get_many() call. The rest are then
+# served from the per-request cache.
+#
+#   { a: service(id: 1) { name }  b: service(id: 2) { name } ... }
+#   -> one get_many([1, 2, ...]) instead of one query per alias
+
+from typing import Dict, Iterator, List, Optional
+
+from graphql import (
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLResolveInfo,
+    InlineFragmentNode,
+    SelectionSetNode,
+)
+from graphql.utilities import value_from_ast_untyped
+
+from app.store.base import ServiceRecord, ServiceStore
+
+
+def iter_fields(
+    selection_set: Optional[SelectionSetNode],
+    fragments: dict,
+    _seen: Optional[set] = None,
+) -> Iterator[FieldNode]:
+    # Every field in a selection set, with fragment spreads / inline fragments flattened
+    if selection_set is None:
+        return
+    seen = _seen if _seen is not None else set()
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            yield selection
+        elif isinstance(selection, InlineFragmentNode):
+            yield from iter_fields(selection.selection_set, fragments, seen)
+        elif isinstance(selection, FragmentSpreadNode):
+            name = selection.name.value
+            if name in seen or name not in fragments:
+                continue
+            seen.add(name)
+            yield from iter_fields(fragments[name].selection_set, fragments, seen)
+
+
+def sibling_argument_values(info: GraphQLResolveInfo, argument: str) -> List:
+    """
+    Values of `argument` on every root field with the current field's name.
+    Only root fields are collected: that is where the id lookups live.
+    Accepts graphql-core's resolve info or strawberry's Info wrapper.
+    """
+    info = getattr(info, "_raw_info", info)
+    field_name = info.field_name
+    values = []
+    for field in iter_fields(info.operation.selection_set, info.fragments):
+        if field.name.value != field_name:
+            continue
+        for arg in field.arguments or ():
+            if arg.name.value == argument:
+                values.append(value_from_ast_untyped(arg.value, info.variable_values))
+    return values
+
+
+class ServiceLoader:
+    # One per GraphQL request; caches what it loaded for that request only
+
+    def __init__(self, store: ServiceStore) -> None:
+        self._store = store
+        self._cache: Dict[int, Optional[ServiceRecord]] = {}
+        self.batches = 0  # store round trips, for tests and benchmarks
+
+    def load(self, service_id: int, info: Optional[GraphQLResolveInfo] = None) -> Optional[ServiceRecord]:
+        if service_id in self._cache:
+            return self._cache[service_id]
+
+        ids = {service_id}
+        if info is not None:
+            ids.update(v for v in sibling_argument_values(info, "id") if isinstance(v, int))
+        self.load_many(ids)
+        return self._cache[service_id]
+
+    def load_many(self, service_ids) -> Dict[int, Optional[ServiceRecord]]:
+        missing = [i for i in service_ids if i not in self._cache]
+        if missing:
+            found = self._store.get_many(missing)
+            self.batches += 1
+            for i in missing:
+                self._cache[i] = found.get(i)
+        return {i: self._cache[i] for i in service_ids}
+
+    def prime(self, record: ServiceRecord) -> None:
+        # Records fetched some other way (e.g. a list page) can be reused by id
+        self._cache.setdefault(record.id, record)
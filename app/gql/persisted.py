@@ -0,0 +1,132 @@
+# app/gql/persisted.py
+# Purpose: Skip repeated work for repeated GraphQL queries.
+#
+#   PersistedQueries -> Automatic Persisted Queries (Apollo APQ protocol):
+#                       clients send only the SHA-256 of a query they sent before
+#   DocumentCache    -> schema extension; parsed document + validation errors
+#                       per query hash, so a known query is never re-parsed or
+#                       re-validated (depth/complexity checks included)
+#   result_cache_key -> key for caching whole results of identical
+#                       query + variables at the same store version
+#
+# All caches are bounded LRUs (app/cache/backends.LRUCache).
+
+import hashlib
+import json
+import math
+from typing import Any, Iterator, Optional, Tuple
+
+from graphql import DocumentNode, OperationType, get_operation_ast
+from strawberry.extensions import SchemaExtension
+
+from app.cache.backends import MISSING, LRUCache
+
+APQ_VERSION = 1
+
+
+def query_hash(query: str) -> str:
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryError(Exception):
+    # message/code follow Apollo's APQ protocol, which clients match on
+    def __init__(self, message: str, code: str) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class PersistedQueries:
+    """
+    hash -> query text registry.
+    A request with extensions.persistedQuery.sha256Hash and no query is looked
+    up here; one that carries both registers the query (after checking the hash).
+    """
+
+    def __init__(self, maxsize: int = 1000) -> None:
+        self._queries = LRUCache(maxsize=maxsize, ttl=math.inf)
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+    def resolve(self, query: Optional[str], extensions: Optional[dict]) -> Tuple[Optional[str], Optional[str]]:
+        """
+        (query text, sha256) for a request.
+        Raises PersistedQueryError for an unknown hash or a hash mismatch.
+        """
+        persisted = (extensions or {}).get("persistedQuery")
+        if not isinstance(persisted, dict):
+            return query, query_hash(query) if query else None
+
+        if persisted.get("version") != APQ_VERSION:
+            raise PersistedQueryError("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED")
+        sha = persisted.get("sha256Hash")
+        if not isinstance(sha, str):
+            raise PersistedQueryError("persistedQuery.sha256Hash must be a string", "BAD_REQUEST")
+
+        if query is None:
+            query = self._queries.get(sha)
+            if query is MISSING:
+                raise PersistedQueryError("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND")
+            return query, sha
+
+        if query_hash(query) != sha:
+            raise PersistedQueryError("provided sha does not match query", "BAD_REQUEST")
+        self._queries.set(sha, query)
+        return query, sha
+
+    def clear(self) -> None:
+        self._queries.clear()
+
+
+class CachedDocument:
+    __slots__ = ("document", "errors")
+
+    def __init__(self, document: DocumentNode) -> None:
+        self.document = document
+        self.errors = None  # validation errors; [] once validated OK
+
+    def is_query(self, operation_name: Optional[str]) -> bool:
+        operation = get_operation_ast(self.document, operation_name)
+        return operation is not None and operation.operation == OperationType.QUERY
+
+
+class DocumentCache(SchemaExtension):
+    """
+    Parse + validation cache keyed by query hash. The cache object is shared;
+    pass the extension as a factory: lambda: DocumentCache(documents).
+    Validation rules are fixed per schema, so a cached verdict stays valid.
+    """
+
+    def __init__(self, documents: LRUCache) -> None:
+        super().__init__()
+        self._documents = documents
+        self._entry: Optional[CachedDocument] = None
+
+    def on_parse(self) -> Iterator[None]:
+        ctx = self.execution_context
+        key = query_hash(ctx.query) if ctx.query else None
+        entry = self._documents.get(key) if key else MISSING
+
+        if entry is not MISSING:
+            ctx.graphql_document = entry.document
+            self._entry = entry
+        yield
+
+        if entry is MISSING and key and ctx.graphql_document is not None:
+            self._entry = CachedDocument(ctx.graphql_document)
+            self._documents.set(key, self._entry)
+
+    def on_validate(self) -> Iterator[None]:
+        ctx = self.execution_context
+        entry = self._entry
+        if entry is not None and entry.errors is not None:
+            # list() so strawberry's error handling never mutates the cached list
+            ctx.pre_execution_errors = list(entry.errors)
+        yield
+
+        if entry is not None and entry.errors is None:
+            entry.errors = list(ctx.pre_execution_errors or [])
+
+
+def result_cache_key(sha: str, operation_name: Optional[str], variables: Any, version: int) -> str:
+    return json.dumps([sha, operation_name, variables, version], sort_keys=True, separators=(",", ":"))
@@ -0,0 +1,160 @@
+# app/gql/ws.py
+# Purpose: GraphQL over WebSocket (graphql-transport-ws protocol) for Flask.
+#
+# strawberry's Flask view only speaks HTTP, so subscriptions are served from
+# a flask-sock route. Each connection runs its own asyncio loop on the
+# thread flask-sock gives it:
+#   - socket reads happen in an executor thread (flask-sock's receive blocks)
+#   - every "subscribe" message becomes a task streaming schema results
+#   - subscription resolvers wait on Broadcaster.subscribe_async(), so there
+#     is no thread or polling per subscription
+#
+# Protocol: https://github.com/enisdenjo/graphql-ws/blob/master/PROTOCOL.md
+
+import asyncio
+import json
+import logging
+from typing import Any, Callable, Dict, Optional
+
+from graphql import GraphQLError, OperationType
+from simple_websocket import ConnectionClosed
+from strawberry.types.execution import PreExecutionError
+
+logger = logging.getLogger("city_services.graphql_ws")
+
+GRAPHQL_TRANSPORT_WS_PROTOCOL = "graphql-transport-ws"
+
+# Close codes from the protocol
+BAD_REQUEST = 4400
+UNAUTHORIZED = 4401
+CONNECTION_INIT_TIMEOUT = 4408
+SUBSCRIBER_ALREADY_EXISTS = 4409
+TOO_MANY_INIT_REQUESTS = 4429
+
+
+class GraphQLTransportWSSession:
+    def __init__(
+        self,
+        ws,
+        schema,
+        context_factory: Callable[[], Any],
+        connection_init_timeout: float = 10.0,
+    ) -> None:
+        self._ws = ws
+        self._schema = schema
+        self._context_factory = context_factory
+        self._init_timeout = connection_init_timeout
+        self._acknowledged = False
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._closed = False
+
+    def run(self) -> None:
+        # Blocks the calling (flask-sock) thread until the socket closes
+        asyncio.run(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while not self._closed:
+                timeout = None if self._acknowledged else self._init_timeout
+                raw = await loop.run_in_executor(None, self._ws.receive, timeout)
+                if raw is None:
+                    if not self._acknowledged:
+                        self._close(CONNECTION_INIT_TIMEOUT, "Connection initialisation timeout")
+                    continue
+                await self._handle(raw)
+        except ConnectionClosed:
+            pass
+        finally:
+            self._closed = True
+            for task in list(self._tasks.values()):
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _handle(self, raw) -> None:
+        try:
+            message = json.loads(raw)
+            kind = message["type"]
+        except (ValueError, TypeError, KeyError):
+            self._close(BAD_REQUEST, "Invalid message received")
+            return
+
+        if kind == "connection_init":
+            if self._acknowledged:
+                self._close(TOO_MANY_INIT_REQUESTS, "Too many initialisation requests")
+                return
+            self._acknowledged = True
+            self._send({"type": "connection_ack"})
+
+        elif kind == "ping":
+            self._send({"type": "pong"})
+
+        elif kind == "pong":
+            pass
+
+        elif kind == "subscribe":
+            if not self._acknowledged:
+                self._close(UNAUTHORIZED, "Unauthorized")
+                return
+            op_id, payload = message.get("id"), message.get("payload")
+            if not isinstance(op_id, str) or not isinstance(payload, dict):
+                self._close(BAD_REQUEST, "Invalid subscribe message")
+                return
+            if op_id in self._tasks:
+                self._close(SUBSCRIBER_ALREADY_EXISTS, f"Subscriber for {op_id} already exists")
+                return
+            self._tasks[op_id] = asyncio.create_task(self._operation(op_id, payload))
+
+        elif kind == "complete":
+            task = self._tasks.pop(message.get("id"), None)
+            if task is not None:
+                task.cancel()
+
+        else:
+            self._close(BAD_REQUEST, f"Unknown message type: {kind}")
+
+    async def _operation(self, op_id: str, payload: dict) -> None:
+        # Streams one operation: many "next" for subscriptions, one for queries
+        try:
+            results = await self._schema.stream(
+                payload.get("query"),
+                variable_values=payload.get("variables"),
+                context_value=self._context_factory(),
+                operation_name=payload.get("operationName"),
+                operation_extensions=payload.get("extensions"),
+                allowed_operation_types=(OperationType.QUERY, OperationType.SUBSCRIPTION),
+            )
+            async for result in results:
+                if isinstance(result, PreExecutionError):
+                    self._send({"id": op_id, "type": "error",
+                                "payload": [e.formatted for e in result.errors]})
+                    return
+                self._send({"id": op_id, "type": "next", "payload": _format(result)})
+            self._send({"id": op_id, "type": "complete"})
+        except asyncio.CancelledError:
+            raise
+        except ConnectionClosed:
+            pass
+        except Exception as e:
+            logger.exception("GraphQL WebSocket operation failed")
+            self._send({"id": op_id, "type": "error", "payload": [GraphQLError(str(e)).formatted]})
+        finally:
+            if self._tasks.get(op_id) is asyncio.current_task():
+                del self._tasks[op_id]
+
+    def _send(self, message: dict) -> None:
+        if not self._closed:
+            self._ws.send(json.dumps(message))
+
+    def _close(self, code: int, reason: str) -> None:
+        if not self._closed:
+            self._closed = True
+            self._ws.close(reason=code, message=reason)
+
+
+def _format(result) -> dict:
+    payload: Dict[str, Optional[Any]] = {"data": result.data}
+    if result.errors:
+        payload["errors"] = [e.formatted for e in result.errors]
+    return payload
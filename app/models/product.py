@@ -2,6 +2,8 @@
 # Purpose: Pydantic schemas (request/response models) for Product.
 # FastAPI uses these for input validation + Swagger/OpenAPI generation.
 
+from enum import Enum
+
 from pydantic import BaseModel, Field
 
 # Product models. Create name and id fields.
@@ -13,3 +15,19 @@ class ProductCreate(BaseModel):
 class Product(ProductCreate):
     # Response model includes server-generated id
     id: int
+
+
+class ProductSort(str, Enum):
+    # Sort orders for GET /products ("-" = descending)
+    id_asc = "id"
+    id_desc = "-id"
+    name_asc = "name"
+    name_desc = "-name"
+
+    @property
+    def by_name(self) -> bool:
+        return self in (ProductSort.name_asc, ProductSort.name_desc)
+
+    @property
+    def descending(self) -> bool:
+        return self.value.startswith("-")
@@ -0,0 +1,78 @@
+# app/ndjson.py
+# Purpose: JSON Lines (NDJSON) helpers shared by the Flask and FastAPI bulk endpoints.
+# Input is parsed one line at a time, so memory stays flat no matter how big the upload is.
+
+import json
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Tuple
+
+from app.responses import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Only the first N per-line errors are listed in a report (all are counted)
+MAX_REPORTED_ERRORS = 1000
+
+
+ParsedLine = Tuple[int, Optional[dict], Optional[str]]
+
+
+def parse_line(raw: bytes) -> Tuple[Optional[dict], Optional[str]]:
+    # (object, None) for a valid JSON object line, otherwise (None, error message)
+    try:
+        obj: Any = json.loads(raw)
+    except ValueError as e:
+        return None, f"invalid JSON: {e}"
+    if not isinstance(obj, dict):
+        return None, "expected a JSON object"
+    return obj, None
+
+
+def parse_lines(lines: Iterable[bytes]) -> Iterator[ParsedLine]:
+    """
+    Yield (line_number, object, error) for every non-blank line.
+    Exactly one of object / error is set; line numbers start at 1.
+    """
+    for line_no, raw in enumerate(lines, start=1):
+        raw = raw.strip()
+        if raw:
+            yield (line_no, *parse_line(raw))
+
+
+async def aparse_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[ParsedLine]:
+    # Async version of parse_lines for a raw byte stream (e.g. Starlette's request.stream())
+    line_no = 0
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for raw in lines:
+            line_no += 1
+            raw = raw.strip()
+            if raw:
+                yield (line_no, *parse_line(raw))
+    if pending.strip():
+        yield (line_no + 1, *parse_line(pending.strip()))
+
+
+def encode_line(obj: dict) -> bytes:
+    return dumps(obj) + b"\n"
+
+
+class ImportReport:
+    # Result of a bulk import: how many rows went in and what went wrong where
+    def __init__(self) -> None:
+        self.created = 0
+        self.error_count = 0
+        self.errors: List[dict] = []
+
+    def add_error(self, line_no: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({"line": line_no, "error": message})
+
+    def to_dict(self) -> dict:
+        return {
+            "created": self.created,
+            "error_count": self.error_count,
+            "errors": self.errors,
+        }
@@ -0,0 +1,60 @@
+# app/routers/product_pages.py
+# Purpose: HTTP helpers for paged/streamed GET /products,
+# shared by the sync routes (api_fastapi.py) and the async router.
+
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from fastapi import HTTPException
+from starlette.requests import Request
+
+from app.models.product import ProductSort
+from app.responses import product_rows_to_json
+from app.services.product_service import ProductRow
+
+
+def check_cursor(sort: ProductSort, after_id: Optional[int], after_name: Optional[str]) -> None:
+    # Name sorts need the full (after_name, after_id) cursor; id sorts only after_id
+    if sort.by_name and (after_id is None) != (after_name is None):
+        raise HTTPException(
+            status_code=400,
+            detail="Name sorts need both after_name and after_id (copy them from the Link header)",
+        )
+    if not sort.by_name and after_name is not None:
+        raise HTTPException(status_code=400, detail="after_name is only valid with sort=name or sort=-name")
+
+
+def next_page_headers(request: Request, last: ProductRow, sort: ProductSort) -> Dict[str, str]:
+    # Cursor for the next page: a ready-to-follow Link plus the raw id
+    last_id, last_name = last[0], last[1]
+    params = {"after_id": last_id}
+    if sort.by_name:
+        params["after_name"] = last_name
+    next_url = request.url.include_query_params(**params)
+    return {"Link": f'<{next_url}>; rel="next"', "X-Next-After-Id": str(last_id)}
+
+
+def _encode_page(page: List[ProductRow], first: bool) -> bytes:
+    # Array items without the surrounding brackets
+    body = product_rows_to_json(page)[1:-1]
+    return body if first else b"," + body
+
+
+def json_array_chunks(pages: Iterable[List[ProductRow]]) -> Iterator[bytes]:
+    # Stream pages of products as one JSON array, a page per chunk
+    yield b"["
+    first = True
+    for page in pages:
+        if page:
+            yield _encode_page(page, first)
+            first = False
+    yield b"]"
+
+
+async def ajson_array_chunks(pages: AsyncIterable[List[ProductRow]]) -> AsyncIterator[bytes]:
+    yield b"["
+    first = True
+    async for page in pages:
+        if page:
+            yield _encode_page(page, first)
+            first = False
+    yield b"]"
@@ -0,0 +1,87 @@
+# app/routers/products_async.py
+# Purpose: async def product CRUD routes, used instead of the sync ones
+# in api_fastapi.py when DB_MODE=async.
+# Same paths, status codes and response models as the sync routes.
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from typing import List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import config
+from app.db.deps import get_async_db
+from app.models.product import ProductCreate, Product, ProductSort
+from app.responses import FastJSONResponse, product_rows_to_json
+from app.routers.product_pages import ajson_array_chunks, check_cursor, next_page_headers
+from app.services.async_product_service import AsyncProductService
+
+router = APIRouter()
+
+
+def get_async_product_service(db: AsyncSession = Depends(get_async_db)) -> AsyncProductService:
+    return AsyncProductService(db)
+
+
+@router.get("/products", response_model=List[Product])
+async def get_products(
+    request: Request,
+    after_id: Optional[int] = Query(None, ge=0),
+    after_name: Optional[str] = None,
+    limit: int = Query(config.PRODUCTS_PAGE_DEFAULT, ge=1, le=config.PRODUCTS_PAGE_MAX),
+    name_prefix: Optional[str] = Query(None, min_length=1, max_length=50),
+    sort: ProductSort = ProductSort.id_asc,
+    stream: bool = False,
+    service: AsyncProductService = Depends(get_async_product_service),
+):
+    if stream:
+        pages = service.iter_pages(config.BULK_BATCH_SIZE, name_prefix)
+        return StreamingResponse(ajson_array_chunks(pages), media_type="application/json")
+
+    check_cursor(sort, after_id, after_name)
+
+    page = await service.get_page(limit + 1, after_id, after_name, name_prefix, sort)
+    headers = {}
+    if len(page) > limit:
+        page = page[:limit]
+        headers = next_page_headers(request, page[-1], sort)
+    return FastJSONResponse(product_rows_to_json(page), headers=headers)
+
+
+@router.get("/products/{product_id}", response_model=Product)
+async def get_product(product_id: int, service: AsyncProductService = Depends(get_async_product_service)):
+    product = await service.get_by_id(product_id)
+
+    if product is None:
+        raise HTTPException(status_code=404, detail=f"No product found with id={product_id}")
+
+    return product
+
+
+@router.post("/products", response_model=Product, status_code=201)
+async def create_product(request: ProductCreate, service: AsyncProductService = Depends(get_async_product_service)):
+    return await service.create(request)
+
+
+@router.put("/products/{product_id}", response_model=Product)
+async def update_product(
+    product_id: int,
+    request: ProductCreate,
+    service: AsyncProductService = Depends(get_async_product_service),
+):
+    updated = await service.update(product_id, request)
+    if updated is None:
+        raise HTTPException(status_code=404, detail=f"No product found with id={product_id}")
+    return updated
+
+
+@router.delete("/products/{product_id}", status_code=200)
+async def delete_product(
+    product_id: int,
+    service: AsyncProductService = Depends(get_async_product_service),
+):
+    deleted = await service.delete(product_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail=f"No product found with id={product_id}")
+
+    return {"message": f"Deleted product id={product_id}"}
@@ -0,0 +1,116 @@
+# app/services/async_product_service.py
+# Purpose: Async version of ProductService for DB_MODE=async.
+# Same behaviour as ProductService, but awaits an AsyncSession so requests
+# don't hold a threadpool slot while SQLite works. Writes use single
+# statements with RETURNING, so there is no follow-up SELECT/refresh.
+
+from typing import AsyncIterator, List, Optional
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.product import ProductCreate, Product, ProductSort
+from app.db.models import ProductDB
+from app.services.product_service import ProductRow, page_query
+
+import logging
+logger = logging.getLogger("city_services.async_product_service")
+
+
+class AsyncProductService:
+    def __init__(self, db: AsyncSession) -> None:
+        # Store the async DB session for this request
+        self._db = db
+
+    async def get_all(self) -> List[Product]:
+        logger.info("Getting all products")
+
+        result = await self._db.execute(select(ProductDB.id, ProductDB.name))
+        return [Product(id=r.id, name=r.name) for r in result]
+
+    async def get_page(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        after_name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        sort: ProductSort = ProductSort.id_asc,
+    ) -> List[ProductRow]:
+        result = await self._db.execute(page_query(limit, after_id, after_name, name_prefix, sort))
+        return result.all()
+
+    async def iter_pages(self, batch_size: int = 1000, name_prefix: Optional[str] = None) -> AsyncIterator[List[ProductRow]]:
+        # All products in id order, batch_size at a time (keyset pagination)
+        last_id = None
+        while True:
+            page = await self.get_page(batch_size, after_id=last_id, name_prefix=name_prefix)
+            if not page:
+                return
+
+            yield page
+            last_id = page[-1][0]
+
+    async def get_by_id(self, product_id: int) -> Optional[Product]:
+        result = await self._db.execute(
+            select(ProductDB.id, ProductDB.name).where(ProductDB.id == product_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+        return Product(id=row.id, name=row.name)
+
+    async def create(self, request: ProductCreate) -> Product:
+        logger.info("Creating product name=%s", request.name)
+
+        result = await self._db.execute(
+            insert(ProductDB).values(name=request.name).returning(ProductDB.id, ProductDB.name)
+        )
+        row = result.one()
+        await self._db.commit()
+
+        logger.info("Created product id=%s name=%s", row.id, row.name)
+        return Product(id=row.id, name=row.name)
+
+    async def update(self, product_id: int, request: ProductCreate) -> Optional[Product]:
+        """
+        Update an existing product.
+        Returns updated Product or None if not found.
+        """
+        logger.info("Updating product id=%s name=%s", product_id, request.name)
+
+        result = await self._db.execute(
+            update(ProductDB)
+            .where(ProductDB.id == product_id)
+            .values(name=request.name)
+            .returning(ProductDB.id, ProductDB.name)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        if row is None:
+            await self._db.rollback()
+            return None
+        await self._db.commit()
+
+        logger.info("Updated product id=%s name=%s", row.id, row.name)
+        return Product(id=row.id, name=row.name)
+
+    async def delete(self, product_id: int) -> bool:
+        """
+        Delete an existing product.
+        Returns True if deleted, False if not found.
+        """
+        logger.info("Deleting product id=%s", product_id)
+
+        result = await self._db.execute(
+            delete(ProductDB)
+            .where(ProductDB.id == product_id)
+            .returning(ProductDB.id, ProductDB.name)
+            .execution_options(synchronize_session=False)
+        )
+        row = result.first()
+        if row is None:
+            await self._db.rollback()
+            return False
+        await self._db.commit()
+
+        logger.info("Deleted product id=%s name=%s", row.id, row.name)
+        return True
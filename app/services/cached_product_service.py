@@ -0,0 +1,124 @@
+# app/services/cached_product_service.py
+# Purpose: ProductService with a read-through cache in front of the reads.
+# get_by_id / get_all are served from a shared ReadThroughCache; every write
+# goes to the DB first and then invalidates the affected keys.
+#
+# List reads (get_all, get_page) are keyed by a "list token" that every write
+# replaces, so one write invalidates every cached page at once.
+#
+# With the in-process LRU backend each worker has its own cache, so other
+# workers may serve a stale product for up to PRODUCT_CACHE_TTL seconds.
+# Use the Redis backend when several workers must see writes immediately.
+
+import uuid
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from app import config
+from app.cache.backends import MISSING, LRUCache, RedisCache
+from app.cache.read_through import ReadThroughCache
+from app.models.product import ProductCreate, Product, ProductSort
+from app.services.product_service import ProductRow, ProductService
+
+ALL_KEY = "products:all"
+LIST_TOKEN_KEY = "products:list_token"
+
+
+def product_key(product_id: int) -> str:
+    return f"product:{product_id}"
+
+
+def build_product_cache() -> Optional[ReadThroughCache]:
+    # Cache configured by PRODUCT_CACHE_BACKEND (lru | redis | none)
+    backend = config.PRODUCT_CACHE_BACKEND
+    if backend == "none":
+        return None
+    if backend == "lru":
+        return ReadThroughCache(LRUCache(config.PRODUCT_CACHE_MAXSIZE, config.PRODUCT_CACHE_TTL))
+    if backend == "redis":
+        return ReadThroughCache(RedisCache(config.REDIS_URL, config.PRODUCT_CACHE_TTL))
+    raise ValueError(f"Unknown PRODUCT_CACHE_BACKEND: {backend}")
+
+
+class CachedProductService(ProductService):
+    def __init__(self, db: Session, cache: ReadThroughCache) -> None:
+        super().__init__(db)
+        self._cache = cache
+
+    # ---------------- reads (cached) ----------------
+
+    def get_all(self) -> List[Product]:
+        return self._cache.get_or_load(ALL_KEY, super().get_all)
+
+    def get_page(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        after_name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        sort: ProductSort = ProductSort.id_asc,
+    ) -> List[ProductRow]:
+        key = f"products:page:{self._list_token()}:{sort.value}:{limit}:{after_id}:{after_name!r}:{name_prefix!r}"
+        return self._cache.get_or_load(
+            key,
+            lambda: super(CachedProductService, self).get_page(limit, after_id, after_name, name_prefix, sort),
+        )
+
+    def get_by_id(self, product_id: int) -> Optional[Product]:
+        return self._cache.get_or_load(
+            product_key(product_id), lambda: super(CachedProductService, self).get_by_id(product_id)
+        )
+
+    # ---------------- writes (invalidate after the DB commit) ----------------
+
+    def create(self, request: ProductCreate) -> Product:
+        created = super().create(request)
+        self._invalidate()
+        return created
+
+    def update(self, product_id: int, request: ProductCreate) -> Optional[Product]:
+        updated = super().update(product_id, request)
+        self._invalidate(product_key(product_id))
+        return updated
+
+    def delete(self, product_id: int) -> bool:
+        deleted = super().delete(product_id)
+        self._invalidate(product_key(product_id))
+        return deleted
+
+    def create_many(self, requests: List[ProductCreate]) -> List[Product]:
+        created = super().create_many(requests)
+        self._invalidate()
+        return created
+
+    def update_many(self, items: List[Product]) -> List[Product]:
+        updated = super().update_many(items)
+        self._invalidate(*(product_key(i.id) for i in items))
+        return updated
+
+    def delete_many(self, product_ids: List[int]) -> List[int]:
+        deleted = super().delete_many(product_ids)
+        self._invalidate(*(product_key(i) for i in product_ids))
+        return deleted
+
+    def import_names(self, names: List[str]) -> int:
+        count = super().import_names(names)
+        self._invalidate()
+        return count
+
+    # ---------------- helpers ----------------
+
+    def _list_token(self) -> str:
+        token = self._cache.backend.get(LIST_TOKEN_KEY)
+        if token is MISSING:
+            # First use, or the token was evicted/expired: start a fresh one.
+            # A random token (not a counter) can never bring back old pages.
+            token = uuid.uuid4().hex
+            self._cache.backend.set(LIST_TOKEN_KEY, token)
+        return token
+
+    def _invalidate(self, *product_keys: str) -> None:
+        # Every write changes some list: new token, drop get_all and the touched products
+        self._cache.backend.set(LIST_TOKEN_KEY, uuid.uuid4().hex)
+        self._cache.invalidate(ALL_KEY, *product_keys)
@@ -2,15 +2,64 @@
 # Purpose: Business logic for Products (CRUD).
 # Now uses SQLite via SQLAlchemy Session (like EF Core DbContext).
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Sequence, Tuple
+from sqlalchemy import Select, case, delete, insert, select, tuple_, update
 from sqlalchemy.orm import Session
 
-from app.models.product import ProductCreate, Product
+from app.models.product import ProductCreate, Product, ProductSort
 from app.db.models import ProductDB
 
 import logging
 logger = logging.getLogger("city_services.product_service")
 
+# Raw (id, name) row for list endpoints; these skip Product construction
+# and are encoded straight to JSON (see app/responses.py)
+ProductRow = Tuple[int, str]
+
+# Rows per UPDATE/DELETE statement in the batch methods.
+# Keeps bound parameters well under SQLite's per-statement limit.
+BATCH_CHUNK_SIZE = 1000
+
+
+def _chunks(items: Sequence, size: int = BATCH_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def page_query(
+    limit: int,
+    after_id: Optional[int] = None,
+    after_name: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    sort: ProductSort = ProductSort.id_asc,
+) -> Select:
+    """
+    SELECT id, name for one keyset page of products.
+    The cursor is the last row of the previous page: after_id for id sorts,
+    (after_name, after_id) for name sorts. No OFFSET, so every page costs
+    the same no matter how deep it is. Shared by the sync and async services.
+    """
+    stmt = select(ProductDB.id, ProductDB.name)
+
+    if name_prefix:
+        # Range scan on the name index (a LIKE would skip it)
+        upper = name_prefix[:-1] + chr(ord(name_prefix[-1]) + 1)
+        stmt = stmt.where(ProductDB.name >= name_prefix, ProductDB.name < upper)
+
+    if sort.by_name:
+        key = tuple_(ProductDB.name, ProductDB.id)
+        if after_name is not None and after_id is not None:
+            cursor = tuple_(after_name, after_id)
+            stmt = stmt.where(key < cursor if sort.descending else key > cursor)
+        order = (ProductDB.name.desc(), ProductDB.id.desc()) if sort.descending else (ProductDB.name, ProductDB.id)
+    else:
+        if after_id is not None:
+            stmt = stmt.where(ProductDB.id < after_id if sort.descending else ProductDB.id > after_id)
+        order = (ProductDB.id.desc(),) if sort.descending else (ProductDB.id,)
+
+    return stmt.order_by(*order).limit(limit)
+
+
 class ProductService:
     def __init__(self, db: Session) -> None:
         # Store the DB session for this request
@@ -25,6 +74,17 @@ class ProductService:
         # Convert DB models -> API models (Pydantic)
         return [Product(id=r.id, name=r.name) for r in rows]
 
+    def get_page(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        after_name: Optional[str] = None,
+        name_prefix: Optional[str] = None,
+        sort: ProductSort = ProductSort.id_asc,
+    ) -> List[ProductRow]:
+        # One keyset page (see page_query) as (id, name) tuples; memory is bounded by `limit`
+        return self._db.execute(page_query(limit, after_id, after_name, name_prefix, sort)).all()
+
     def get_by_id(self, product_id: int) -> Optional[Product]:
         row = self._db.query(ProductDB).filter(ProductDB.id == product_id).first()
         if row is None:
@@ -78,3 +138,104 @@ class ProductService:
 
         logger.info("Deleted product id=%s name=%s", row.id, row.name)
         return True
+
+    # ---------------- batch CRUD (one transaction per call) ----------------
+
+    def create_many(self, requests: List[ProductCreate]) -> List[Product]:
+        """
+        Insert many products in a single transaction.
+        Uses INSERT ... RETURNING, so generated ids come back without a refresh per row.
+        Results are in the same order as the requests.
+        """
+        if not requests:
+            return []
+
+        logger.info("Creating %s products", len(requests))
+
+        rows = self._db.execute(
+            insert(ProductDB).returning(ProductDB.id, ProductDB.name, sort_by_parameter_order=True),
+            [{"name": r.name} for r in requests],
+        ).all()
+        self._db.commit()
+
+        return [Product(id=r.id, name=r.name) for r in rows]
+
+    def update_many(self, items: List[Product]) -> List[Product]:
+        """
+        Rename many products in a single transaction.
+        Each chunk is one UPDATE ... SET name = CASE id ... END ... RETURNING,
+        so there is no SELECT first and no refresh afterwards.
+        Returns the products that existed (ids not found are skipped).
+        If an id appears twice, the last name wins.
+        """
+        names = {item.id: item.name for item in items}
+        if not names:
+            return []
+
+        logger.info("Updating %s products", len(names))
+
+        updated = {}
+        for ids in _chunks(list(names)):
+            rows = self._db.execute(
+                update(ProductDB)
+                .where(ProductDB.id.in_(ids))
+                .values(name=case({i: names[i] for i in ids}, value=ProductDB.id))
+                .returning(ProductDB.id, ProductDB.name)
+                .execution_options(synchronize_session=False)
+            ).all()
+            updated.update((r.id, r.name) for r in rows)
+        self._db.commit()
+
+        return [Product(id=i, name=updated[i]) for i in names if i in updated]
+
+    def delete_many(self, product_ids: List[int]) -> List[int]:
+        """
+        Delete many products in a single transaction (DELETE ... WHERE id IN ... RETURNING).
+        Returns the ids that were actually deleted.
+        """
+        ids = list(dict.fromkeys(product_ids))
+        if not ids:
+            return []
+
+        logger.info("Deleting %s products", len(ids))
+
+        deleted = []
+        for chunk in _chunks(ids):
+            deleted.extend(self._db.execute(
+                delete(ProductDB)
+                .where(ProductDB.id.in_(chunk))
+                .returning(ProductDB.id)
+                .execution_options(synchronize_session=False)
+            ).scalars())
+        self._db.commit()
+
+        return sorted(deleted)
+
+    def import_names(self, names: List[str]) -> int:
+        """
+        Insert many products in one transaction (a single executemany).
+        Used by bulk import; returns how many rows were inserted.
+        """
+        if not names:
+            return 0
+
+        self._db.execute(insert(ProductDB), [{"name": n} for n in names])
+        self._db.commit()
+
+        logger.info("Imported %s products", len(names))
+        return len(names)
+
+    def iter_pages(self, batch_size: int = 1000, name_prefix: Optional[str] = None) -> Iterator[List[ProductRow]]:
+        """
+        Yield all products (optionally only names starting with name_prefix)
+        in id order, batch_size at a time. Uses keyset pagination, so each
+        query is cheap and only one batch is in memory at once.
+        """
+        last_id = None
+        while True:
+            rows = self._db.execute(page_query(batch_size, after_id=last_id, name_prefix=name_prefix)).all()
+            if not rows:
+                return
+
+            yield rows
+            last_id = rows[-1][0]
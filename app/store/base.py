@@ -0,0 +1,165 @@
+# app/store/base.py
+# Purpose: Storage interface for the Flask city_services API.
+# api.py only talks to a ServiceStore, so the data can live in process
+# memory (InMemoryServiceStore) or in SQLite via SQLAlchemy (SqlServiceStore).
+# Pick one with SERVICE_STORE=memory|sql.
+
+import hashlib
+import json
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+
+class ServiceRecord:
+    # One city service. __slots__ keeps each record small
+    # (no per-instance __dict__), which matters with ~1M entries.
+    # Treat records as read-only once they are in the store.
+    __slots__ = ("id", "name", "type", "version", "_encoded")
+
+    def __init__(self, id: int, name: str, type: Optional[str], version: int = 1) -> None:
+        self.id = id
+        self.name = name
+        self.type = type
+        self.version = version
+        self._encoded: Optional[Tuple[bytes, str]] = None
+
+    def to_dict(self) -> dict:
+        # Same JSON shape the API has always returned
+        return {"id": self.id, "name": self.name, "type": self.type}
+
+    def encoded(self) -> Tuple[bytes, str]:
+        """
+        (JSON body bytes, strong ETag) for this version of the record.
+        Computed on first use, then served from the record.
+        """
+        cached = self._encoded
+        if cached is None:
+            body = json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":")).encode("utf-8")
+            cached = self._encoded = (body, '"' + hashlib.md5(body).hexdigest() + '"')
+        return cached
+
+
+class EncodedPage(NamedTuple):
+    body: bytes                 # JSON array, ready to send
+    etag: str                   # weak ETag for the collection version
+    next_cursor: Optional[int]  # pass as ?cursor= to get the next page
+    version: int
+
+
+class ServiceStore:
+    """
+    What api.py needs from a city services store.
+    Every write bumps `version`; `etag` is derived from it.
+    """
+
+    # Max cached list pages; the cache is dropped wholesale when full
+    PAGE_CACHE_SIZE = 128
+
+    def __init__(self) -> None:
+        self._page_cache: Dict[tuple, EncodedPage] = {}
+
+    # ---------------- to implement ----------------
+
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def version(self) -> int:
+        raise NotImplementedError
+
+    @property
+    def etag(self) -> str:
+        # Weak ETag for the whole collection at its current version
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def snapshot(self) -> List[ServiceRecord]:
+        # Point-in-time copy of all records, in id order
+        raise NotImplementedError
+
+    def page(
+        self,
+        cursor: int = 0,
+        limit: Optional[int] = None,
+        type: Optional[str] = None,
+    ) -> Tuple[List[ServiceRecord], Optional[int]]:
+        """
+        Records with id > cursor (optionally only those of the given type),
+        at most `limit` of them. Also returns the cursor for the next page,
+        or None when this is the last one.
+        """
+        records, next_cursor, _ = self._versioned_page(cursor, limit, type)
+        return records, next_cursor
+
+    def get_by_id(self, service_id: int) -> Optional[ServiceRecord]:
+        raise NotImplementedError
+
+    def get_many(self, service_ids) -> Dict[int, ServiceRecord]:
+        # id -> record for the ids that exist (one round trip in SQL stores)
+        found = {}
+        for service_id in service_ids:
+            record = self.get_by_id(service_id)
+            if record is not None:
+                found[service_id] = record
+        return found
+
+    def get_by_name(self, name: str) -> Optional[ServiceRecord]:
+        # Oldest (lowest id) service with this name
+        raise NotImplementedError
+
+    def create(self, name: str, type: Optional[str]) -> ServiceRecord:
+        raise NotImplementedError
+
+    def create_many(self, rows: List[Tuple[str, Optional[str]]]) -> List[ServiceRecord]:
+        # Insert many (name, type) rows as one write / version bump
+        raise NotImplementedError
+
+    def update(self, service_id: int, fields: dict) -> Optional[ServiceRecord]:
+        """
+        Update only the provided fields ('name' and/or 'type').
+        Returns the updated record or None if not found.
+        """
+        raise NotImplementedError
+
+    def delete(self, service_id: int) -> bool:
+        """
+        Delete a service.
+        Returns True if deleted, False if not found.
+        """
+        raise NotImplementedError
+
+    def _versioned_page(self, cursor, limit, type) -> Tuple[List[ServiceRecord], Optional[int], int]:
+        # page() plus the collection version it was read at, taken atomically
+        raise NotImplementedError
+
+    # ---------------- shared ----------------
+
+    def all(self) -> List[dict]:
+        return [r.to_dict() for r in self.snapshot()]
+
+    def encoded_page(
+        self,
+        cursor: int = 0,
+        limit: Optional[int] = None,
+        type: Optional[str] = None,
+    ) -> EncodedPage:
+        # Same as page(), but as a cached, pre-encoded JSON array
+        key = (cursor, limit, type)
+        cached = self._page_cache.get(key)
+        if cached is not None and cached.version == self.version:
+            return cached
+
+        records, next_cursor, version = self._versioned_page(cursor, limit, type)
+
+        # Reuse each record's cached body instead of encoding the list again
+        body = b"[" + b",".join(r.encoded()[0] for r in records) + b"]"
+        page = EncodedPage(body, self.etag_for(version), next_cursor, version)
+
+        if len(self._page_cache) >= self.PAGE_CACHE_SIZE:
+            self._page_cache.clear()
+        self._page_cache[key] = page
+        return page
+
+    def etag_for(self, version: int) -> str:
+        raise NotImplementedError
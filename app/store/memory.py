@@ -0,0 +1,201 @@
+# app/store/memory.py
+# Purpose: In-memory store for the Flask city_services API.
+# Replaces the old global list with hash indexes on id and name,
+# so lookups, updates and deletes are O(1) instead of a linear scan.
+#
+# Thread safety (threaded WSGI servers):
+# - Writes take the write side of a ReadWriteLock, so id allocation and
+#   index maintenance happen atomically.
+# - Records are never mutated in place: update() swaps in a new record.
+#   A reader holding a record therefore always sees a consistent row.
+# - get_by_id is a single dict lookup and needs no lock; anything that
+#   iterates (name buckets, all()) takes the read side and returns a snapshot.
+#
+# Response cache: each record lazily keeps its encoded JSON body and ETag.
+# Because updates swap in a new record (with a bumped version) and deletes
+# drop it, the cache is invalidated for free on PUT and DELETE.
+#
+# Collection cache: every write bumps a store-wide version. Encoded list
+# pages are cached per (cursor, limit, type) and only reused while the
+# version is unchanged, so polling an unchanged catalog costs a dict lookup.
+
+import bisect
+import itertools
+import uuid
+from typing import Dict, List, Optional, Tuple
+
+from app.store.base import EncodedPage, ServiceRecord, ServiceStore  # noqa: F401 (re-exported)
+from app.store.locks import ReadWriteLock
+
+
+class InMemoryServiceStore(ServiceStore):
+    # Rebuild the id order list once this many deleted ids pile up in it
+    _COMPACT_AFTER = 1024
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._lock = ReadWriteLock()
+        self._ids = itertools.count(1)
+
+        # Collection version, bumped on every write. The epoch keeps ETags
+        # from a previous process (same version number, different data) from matching.
+        self._version = 0
+        self._epoch = uuid.uuid4().hex[:8]
+
+        # Primary index: id -> record (dicts keep insertion order,
+        # so iterating this gives services in creation order)
+        self._by_id: Dict[int, ServiceRecord] = {}
+
+        # Secondary index: name -> {id: record}
+        # Names are not unique, so each bucket keeps every record with that
+        # name in creation order; lookups by name return the oldest one,
+        # which is what the old linear scan returned.
+        self._by_name: Dict[str, Dict[int, ServiceRecord]] = {}
+
+        # Ids in ascending order (ids only grow, so this is append-only).
+        # Deleted ids stay in place until the next compaction; used to
+        # find a cursor position with bisect.
+        self._order: List[int] = []
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def etag(self) -> str:
+        # Weak ETag for the whole collection at its current version
+        return self.etag_for(self._version)
+
+    def etag_for(self, version: int) -> str:
+        return f'W/"{self._epoch}-{version}"'
+
+    def clear(self) -> None:
+        # Drop all data (used by tests). Ids keep counting up, like before.
+        with self._lock.write():
+            self._by_id.clear()
+            self._by_name.clear()
+            self._order.clear()
+            self._dead = 0
+            self._version += 1
+
+    def snapshot(self) -> List[ServiceRecord]:
+        # Point-in-time copy of all records, safe to iterate
+        # while other threads keep writing.
+        with self._lock.read():
+            return list(self._by_id.values())
+
+    def get_by_id(self, service_id: int) -> Optional[ServiceRecord]:
+        return self._by_id.get(service_id)
+
+    def get_by_name(self, name: str) -> Optional[ServiceRecord]:
+        with self._lock.read():
+            bucket = self._by_name.get(name)
+            if not bucket:
+                return None
+            if len(bucket) == 1:
+                return next(iter(bucket.values()))
+            # A renamed record may sit after newer ones; the oldest id wins
+            return bucket[min(bucket)]
+
+    def create(self, name: str, type: Optional[str]) -> ServiceRecord:
+        with self._lock.write():
+            record = ServiceRecord(next(self._ids), name, type)
+            self._by_id[record.id] = record
+            self._order.append(record.id)
+            self._index_name(record)
+            self._version += 1
+        return record
+
+    def create_many(self, rows: List[Tuple[str, Optional[str]]]) -> List[ServiceRecord]:
+        # Insert many (name, type) rows under a single lock acquisition / version bump
+        with self._lock.write():
+            records = [ServiceRecord(next(self._ids), name, type) for name, type in rows]
+            for record in records:
+                self._by_id[record.id] = record
+                self._order.append(record.id)
+                self._index_name(record)
+            self._version += 1
+        return records
+
+    def update(self, service_id: int, fields: dict) -> Optional[ServiceRecord]:
+        """
+        Update only the provided fields ('name' and/or 'type').
+        Returns the updated record or None if not found.
+        """
+        with self._lock.write():
+            old = self._by_id.get(service_id)
+            if old is None:
+                return None
+
+            record = ServiceRecord(
+                old.id,
+                fields.get("name", old.name),
+                fields.get("type", old.type),
+                old.version + 1,
+            )
+
+            self._unindex_name(old)
+            self._by_id[record.id] = record  # existing key: keeps its position
+            self._index_name(record)
+            self._version += 1
+        return record
+
+    def delete(self, service_id: int) -> bool:
+        """
+        Delete a service.
+        Returns True if deleted, False if not found.
+        """
+        with self._lock.write():
+            record = self._by_id.pop(service_id, None)
+            if record is None:
+                return False
+
+            self._unindex_name(record)
+            self._version += 1
+
+            self._dead += 1
+            if self._dead > self._COMPACT_AFTER and self._dead * 2 > len(self._order):
+                self._order = [i for i in self._order if i in self._by_id]
+                self._dead = 0
+        return True
+
+    def _versioned_page(self, cursor, limit, type) -> Tuple[List[ServiceRecord], Optional[int], int]:
+        with self._lock.read():
+            records, next_cursor = self._page_locked(cursor, limit, type)
+            return records, next_cursor, self._version
+
+    # ---------------- helpers (caller holds the lock) ----------------
+
+    def _page_locked(self, cursor, limit, type) -> Tuple[List[ServiceRecord], Optional[int]]:
+        if limit is None and type is None and cursor <= 0:
+            return list(self._by_id.values()), None
+
+        by_id = self._by_id
+        out: List[ServiceRecord] = []
+        order = self._order
+
+        for pos in range(bisect.bisect_right(order, cursor), len(order)):
+            record = by_id.get(order[pos])
+            if record is None or (type is not None and record.type != type):
+                continue
+            if limit is not None and len(out) == limit:
+                # there is at least one more match after this page
+                return out, out[-1].id
+            out.append(record)
+
+        return out, None
+
+    def _index_name(self, record: ServiceRecord) -> None:
+        self._by_name.setdefault(record.name, {})[record.id] = record
+
+    def _unindex_name(self, record: ServiceRecord) -> None:
+        bucket = self._by_name.get(record.name)
+        if bucket is None:
+            return
+        bucket.pop(record.id, None)
+        if not bucket:
+            del self._by_name[record.name]
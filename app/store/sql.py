@@ -0,0 +1,202 @@
+# app/store/sql.py
+# Purpose: SQLite (SQLAlchemy) store for the Flask city_services API.
+# Same interface as InMemoryServiceStore, but the data lives in the
+# "services" table, so it survives restarts and is shared by every
+# gunicorn worker pointed at the same database.
+#
+# Collection version: a single row in "service_collection" is bumped in
+# the same transaction as each write. Every worker reads it, so list
+# ETags and the per-process page cache stay correct across processes.
+#
+# Record cache: encoded bodies are kept per (id, row version). Ids are
+# never reused (AUTOINCREMENT) and every update bumps the row version,
+# so a cached body can never belong to a different row state.
+
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.db.models import ServiceCollectionDB, ServiceDB
+from app.store.base import ServiceRecord, ServiceStore
+
+_COLUMNS = (ServiceDB.id, ServiceDB.name, ServiceDB.type, ServiceDB.version)
+
+# Rows per INSERT / ids per IN (...) (keeps bound parameters under SQLite's limit)
+_CHUNK_SIZE = 1000
+
+
+class SqlServiceStore(ServiceStore):
+    # Max encoded records kept in this process; dropped wholesale when full
+    RECORD_CACHE_SIZE = 10000
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        read_session_factory: Optional[Callable[[], Session]] = None,
+    ) -> None:
+        super().__init__()
+        self._session = session_factory
+        # GETs go to the read-only pool when there is one (production profile)
+        self._read_session = read_session_factory or session_factory
+        self._records: Dict[Tuple[int, int], ServiceRecord] = {}
+        self._epoch = self._ensure_collection_row()
+
+    def __len__(self) -> int:
+        with self._read_session() as db:
+            return db.scalar(select(func.count()).select_from(ServiceDB))
+
+    @property
+    def version(self) -> int:
+        with self._read_session() as db:
+            return db.scalar(select(ServiceCollectionDB.version).where(ServiceCollectionDB.id == 1))
+
+    @property
+    def etag(self) -> str:
+        return self.etag_for(self.version)
+
+    def etag_for(self, version: int) -> str:
+        return f'W/"{self._epoch}-{version}"'
+
+    def clear(self) -> None:
+        # Drop all data (used by tests). Ids keep counting up, like before.
+        with self._session() as db:
+            db.execute(delete(ServiceDB))
+            self._bump(db)
+            db.commit()
+        self._records.clear()
+
+    def snapshot(self) -> List[ServiceRecord]:
+        with self._read_session() as db:
+            rows = db.execute(select(*_COLUMNS).order_by(ServiceDB.id)).all()
+        return [self._record(row) for row in rows]
+
+    def get_by_id(self, service_id: int) -> Optional[ServiceRecord]:
+        with self._read_session() as db:
+            row = db.execute(select(*_COLUMNS).where(ServiceDB.id == service_id)).first()
+        return self._record(row) if row is not None else None
+
+    def get_many(self, service_ids) -> Dict[int, ServiceRecord]:
+        ids = sorted(set(service_ids))
+        found = {}
+        with self._read_session() as db:
+            for start in range(0, len(ids), _CHUNK_SIZE):
+                rows = db.execute(
+                    select(*_COLUMNS).where(ServiceDB.id.in_(ids[start:start + _CHUNK_SIZE]))
+                ).all()
+                for row in rows:
+                    found[row.id] = self._record(row)
+        return found
+
+    def get_by_name(self, name: str) -> Optional[ServiceRecord]:
+        # Oldest id wins, like the in-memory store (uses the name index)
+        with self._read_session() as db:
+            row = db.execute(
+                select(*_COLUMNS).where(ServiceDB.name == name).order_by(ServiceDB.id).limit(1)
+            ).first()
+        return self._record(row) if row is not None else None
+
+    def create(self, name: str, type: Optional[str]) -> ServiceRecord:
+        return self.create_many([(name, type)])[0]
+
+    def create_many(self, rows: List[Tuple[str, Optional[str]]]) -> List[ServiceRecord]:
+        # All rows in one transaction / version bump
+        if not rows:
+            return []
+        created = []
+        with self._session() as db:
+            for start in range(0, len(rows), _CHUNK_SIZE):
+                created.extend(db.execute(
+                    insert(ServiceDB).returning(*_COLUMNS, sort_by_parameter_order=True),
+                    [{"name": name, "type": type, "version": 1}
+                     for name, type in rows[start:start + _CHUNK_SIZE]],
+                ).all())
+            self._bump(db)
+            db.commit()
+        return [self._record(row) for row in created]
+
+    def update(self, service_id: int, fields: dict) -> Optional[ServiceRecord]:
+        values = {k: fields[k] for k in ("name", "type") if k in fields}
+        with self._session() as db:
+            row = db.execute(
+                update(ServiceDB)
+                .where(ServiceDB.id == service_id)
+                .values(version=ServiceDB.version + 1, **values)
+                .returning(*_COLUMNS)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if row is None:
+                return None
+            self._bump(db)
+            db.commit()
+        return self._record(row)
+
+    def delete(self, service_id: int) -> bool:
+        with self._session() as db:
+            deleted = db.execute(
+                delete(ServiceDB)
+                .where(ServiceDB.id == service_id)
+                .returning(ServiceDB.id)
+                .execution_options(synchronize_session=False)
+            ).first()
+            if deleted is None:
+                return False
+            self._bump(db)
+            db.commit()
+        return True
+
+    def _versioned_page(self, cursor, limit, type) -> Tuple[List[ServiceRecord], Optional[int], int]:
+        stmt = select(*_COLUMNS).where(ServiceDB.id > cursor).order_by(ServiceDB.id)
+        if type is not None:
+            stmt = stmt.where(ServiceDB.type == type)
+        if limit is not None:
+            # one extra row tells us whether there is a next page
+            stmt = stmt.limit(limit + 1)
+
+        # Version first: if a write lands in between, the rows are newer than
+        # the version they are tagged with, so the cached page is simply rebuilt
+        # on the next request (never an old page under a new version)
+        with self._read_session() as db:
+            version = db.scalar(select(ServiceCollectionDB.version).where(ServiceCollectionDB.id == 1))
+            rows = db.execute(stmt).all()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1].id
+        return [self._record(row) for row in rows], next_cursor, version
+
+    # ---------------- helpers ----------------
+
+    def _record(self, row) -> ServiceRecord:
+        # Reuse the cached record (and its encoded body) for this row version
+        key = (row.id, row.version)
+        record = self._records.get(key)
+        if record is None:
+            record = ServiceRecord(row.id, row.name, row.type, row.version)
+            if len(self._records) >= self.RECORD_CACHE_SIZE:
+                self._records.clear()
+            self._records[key] = record
+        return record
+
+    @staticmethod
+    def _bump(db: Session) -> None:
+        db.execute(
+            update(ServiceCollectionDB)
+            .where(ServiceCollectionDB.id == 1)
+            .values(version=ServiceCollectionDB.version + 1)
+        )
+
+    def _ensure_collection_row(self) -> str:
+        # First worker to start creates the row; the rest leave it alone.
+        # Returns the database's epoch (fixed for its lifetime).
+        with self._session() as db:
+            db.execute(
+                sqlite_insert(ServiceCollectionDB)
+                .values(id=1, epoch=uuid.uuid4().hex[:8], version=0)
+                .on_conflict_do_nothing(index_elements=["id"])
+            )
+            db.commit()
+            return db.scalar(select(ServiceCollectionDB.epoch).where(ServiceCollectionDB.id == 1))
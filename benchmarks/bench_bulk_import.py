@@ -0,0 +1,131 @@
+# benchmarks/bench_bulk_import.py
+# Purpose: NDJSON bulk import/export throughput for both APIs, compared with
+# one POST per row. Default is 1M rows; peak RSS is reported so you can see
+# the server side stays flat (the client side holds the Flask upload body).
+#
+# Run:
+#   python -m benchmarks.bench_bulk_import
+#   python -m benchmarks.bench_bulk_import --rows 100000 --skip-flask
+
+import argparse
+import logging
+import os
+import resource
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+
+def rss_mb() -> float:
+    # Peak resident set size of this process so far (Linux reports KiB)
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def ndjson_lines(rows: int, chunk: int = 10_000):
+    # Yields the upload body in chunks so it never exists in full
+    for start in range(0, rows, chunk):
+        yield "".join(
+            f'{{"name": "product-{i}"}}\n' for i in range(start, min(start + chunk, rows))
+        ).encode()
+
+
+def report(label: str, rows: int, seconds: float) -> None:
+    print(f"{label:<36} {rows:>10,} rows {seconds:>8.2f} s {rows / seconds:>12,.0f} rows/s"
+          f"   peak rss {rss_mb():>7.0f} MB")
+
+
+def bench_fastapi(rows: int, per_row_sample: int) -> None:
+    from api_fastapi import app
+    from app.db.deps import get_db, get_read_db
+    from app.db.models import Base
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                               connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def override_get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
+        try:
+            client = TestClient(app)
+
+            start = time.perf_counter()
+            for i in range(per_row_sample):
+                client.post("/products", json={"name": f"single-{i}"})
+            report("FastAPI POST /products (per row)", per_row_sample, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            res = client.post("/products:bulk", content=ndjson_lines(rows))
+            assert res.json()["created"] == rows, res.text
+            report("FastAPI POST /products:bulk", rows, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            count = 0
+            with client.stream("GET", "/products:bulk") as res:
+                for _ in res.iter_lines():
+                    count += 1
+            report("FastAPI GET /products:bulk", count, time.perf_counter() - start)
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+
+def bench_flask(rows: int, per_row_sample: int) -> None:
+    from api import app, city_services
+
+    city_services.clear()
+    client = app.test_client()
+
+    start = time.perf_counter()
+    for i in range(per_row_sample):
+        client.post("/api/v1/city_services", json={"name": f"single-{i}", "type": "Utility"})
+    report("Flask POST city_services (per row)", per_row_sample, time.perf_counter() - start)
+    city_services.clear()
+
+    body = b"".join(ndjson_lines(rows))
+    start = time.perf_counter()
+    res = client.post("/api/v1/city_services:bulk", data=body,
+                      content_type="application/x-ndjson")
+    assert res.get_json()["created"] == rows, res.data[:200]
+    report("Flask POST city_services:bulk", rows, time.perf_counter() - start)
+    del body
+
+    start = time.perf_counter()
+    res = client.get("/api/v1/city_services:bulk", buffered=False)
+    count = sum(chunk.count(b"\n") for chunk in res.response)
+    report("Flask GET city_services:bulk", count, time.perf_counter() - start)
+
+    city_services.clear()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NDJSON bulk import/export benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--per-row-sample", type=int, default=1000,
+                        help="rows sent one POST at a time for comparison")
+    parser.add_argument("--skip-fastapi", action="store_true")
+    parser.add_argument("--skip-flask", action="store_true")
+    args = parser.parse_args()
+
+    # per-request INFO logs would dominate the per-row numbers
+    logging.disable(logging.INFO)
+
+    if not args.skip_fastapi:
+        bench_fastapi(args.rows, args.per_row_sample)
+    if not args.skip_flask:
+        bench_flask(args.rows, args.per_row_sample)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+# benchmarks/bench_fastapi_modes.py
+# Purpose: Load test api_fastapi in sync vs async DB mode.
+# Starts uvicorn in a subprocess for each mode (DB_MODE=sync|async) on a
+# fresh SQLite file, seeds products, then drives it with concurrent HTTP
+# clients and reports requests/s plus p50/p99 latency.
+#
+# Run:
+#   python -m benchmarks.bench_fastapi_modes
+#   python -m benchmarks.bench_fastapi_modes --concurrency 10 50 --seconds 5
+
+import argparse
+import asyncio
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_server(mode: str, db_file: str, port: int) -> subprocess.Popen:
+    env = dict(os.environ, DB_MODE=mode, DATABASE_URL=f"sqlite:///{db_file}")
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "api_fastapi:app",
+         "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+
+    deadline = time.time() + 20
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                return proc
+        except httpx.TransportError:
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError(f"uvicorn ({mode}) did not start")
+
+
+def percentile(sorted_values, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    idx = min(len(sorted_values) - 1, int(len(sorted_values) * pct / 100))
+    return sorted_values[idx]
+
+
+async def drive(base: str, ids, concurrency: int, seconds: float, write_ratio: float):
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + seconds
+
+    async def worker(seed: int):
+        nonlocal errors
+        rng = random.Random(seed)
+        async with httpx.AsyncClient(base_url=base, timeout=30) as client:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                if rng.random() < write_ratio:
+                    res = await client.post("/products", json={"name": f"load-{seed}"})
+                else:
+                    res = await client.get(f"/products/{rng.choice(ids)}")
+                latencies.append(time.perf_counter() - start)
+                if res.status_code >= 400:
+                    errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    return len(latencies) / elapsed, latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="FastAPI sync vs async DB mode load test")
+    parser.add_argument("--modes", nargs="+", default=["sync", "async"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--seed-rows", type=int, default=1000)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'clients':>8} {'req/s':>10} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for mode in args.modes:
+        with tempfile.TemporaryDirectory() as tmp:
+            port = free_port()
+            proc = start_server(mode, os.path.join(tmp, "bench.db"), port)
+            base = f"http://127.0.0.1:{port}"
+            try:
+                seeded = httpx.post(f"{base}/products:batch", timeout=60,
+                                    json=[{"name": f"seed-{i}"} for i in range(args.seed_rows)])
+                ids = [p["id"] for p in seeded.json()]
+
+                for c in args.concurrency:
+                    rps, lat, errors = asyncio.run(
+                        drive(base, ids, c, args.seconds, args.write_ratio))
+                    print(f"{mode:<6} {c:>8} {rps:>10,.0f} {percentile(lat, 50) * 1000:>8.1f}"
+                          f" {percentile(lat, 99) * 1000:>8.1f} {errors:>7}")
+            finally:
+                proc.terminate()
+                proc.wait()
+
+
+if __name__ == "__main__":
+    main()
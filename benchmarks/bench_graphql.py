@@ -0,0 +1,107 @@
+# benchmarks/bench_graphql.py
+# Purpose: Timing for /api/v1/graphql on aliased and bulk queries,
+# against the in-memory store and the SQLite store.
+#
+# Cases:
+#   - aliased: one query with N `service(id:)` aliases, with DataLoader
+#     batching (one get_many) and without (one lookup per alias)
+#   - bulk: `services` (everything) vs one `servicesConnection` page
+# For the SQLite store it also counts the SQL statements each query runs.
+#
+# Run:
+#   python -m benchmarks.bench_graphql
+#   python -m benchmarks.bench_graphql --size 20000 --aliases 500
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+import api
+from app.db.models import Base
+from app.gql.loaders import ServiceLoader
+from app.store.memory import InMemoryServiceStore
+from app.store.sql import SqlServiceStore
+
+
+class UnbatchedLoader(ServiceLoader):
+    # The pre-batching behaviour: one store lookup per field
+    def load(self, service_id, info=None):
+        return super().load(service_id)
+
+
+def per_call_ms(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e3
+
+
+def run_cases(label, store, client, args, statements):
+    ids = [r.id for r in store.create_many([(f"service-{i}", "Utility") for i in range(args.size)])]
+    step = max(len(ids) // args.aliases, 1)
+    aliased = "{ " + " ".join(f"a{i}: service(id: {i}) {{ id name }}" for i in ids[::step][:args.aliases]) + " }"
+    cases = (
+        ("aliased, batched", aliased, ServiceLoader),
+        ("aliased, unbatched", aliased, UnbatchedLoader),
+        ("bulk services", "{ services { id name type } }", ServiceLoader),
+        ("connection first=100", "{ servicesConnection(first: 100) { edges { node { id name type } } } }",
+         ServiceLoader),
+    )
+
+    for case, query, loader_cls in cases:
+        api.ServiceLoader = loader_cls
+
+        def call():
+            resp = client.post("/api/v1/graphql", json={"query": query})
+            assert resp.status_code == 200 and "errors" not in resp.get_json(), resp.get_data()
+
+        call()  # warm up
+        statements[0] = 0
+        ms = per_call_ms(call, args.n)
+        sql = f"{statements[0] / args.n:.0f}" if label == "sqlite" else "-"
+        print(f"{label:<8} {case:<22} {ms:>10.2f} {sql:>8}")
+
+    api.ServiceLoader = ServiceLoader
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GraphQL aliased/bulk query benchmark")
+    parser.add_argument("--size", type=int, default=5_000, help="services in the store")
+    parser.add_argument("--aliases", type=int, default=500)
+    parser.add_argument("--n", type=int, default=20, help="requests per case")
+    args = parser.parse_args()
+
+    # aliased lookups need room under the complexity limit
+    api.config.GRAPHQL_MAX_COMPLEXITY = max(api.config.GRAPHQL_MAX_COMPLEXITY, args.aliases * 4)
+    logging.disable(logging.INFO)
+    client = api.app.test_client()
+    statements = [0]
+
+    print(f"{'store':<8} {'case':<22} {'ms/query':>10} {'SQL':>8}")
+    original = api.city_services
+    try:
+        api.city_services = InMemoryServiceStore()
+        run_cases("memory", api.city_services, client, args, statements)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+            Base.metadata.create_all(bind=engine)
+
+            @event.listens_for(engine, "before_cursor_execute")
+            def _count(*_args):
+                statements[0] += 1
+
+            api.city_services = SqlServiceStore(sessionmaker(bind=engine))
+            run_cases("sqlite", api.city_services, client, args, statements)
+            engine.dispose()
+    finally:
+        api.city_services = original
+
+
+if __name__ == "__main__":
+    main()
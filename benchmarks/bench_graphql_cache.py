@@ -0,0 +1,83 @@
+# benchmarks/bench_graphql_cache.py
+# Purpose: Per-request timing for a repeated "dashboard" GraphQL query,
+# showing what each cache layer saves:
+#   - cold:       document cache emptied before every request (parse + validate each time)
+#   - documents:  parsed/validated document reused (the default)
+#   - apq:        client sends only the SHA-256 (smaller request, same cache)
+#   - results:    whole result reused while the store version is unchanged
+#
+# Run:
+#   python -m benchmarks.bench_graphql_cache
+
+import argparse
+import hashlib
+import logging
+import time
+
+import api
+from app.cache.backends import LRUCache
+
+QUERY = """
+query Dashboard($type: String) {
+  services(type: $type) { id name type }
+  servicesConnection(first: 20) {
+    edges { cursor node { id name } }
+    pageInfo { hasNextPage endCursor }
+  }
+  a: service(id: 1) { name }
+  b: service(id: 2) { name }
+}
+"""
+
+
+def per_call_us(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GraphQL parse/validation/result cache benchmark")
+    parser.add_argument("--size", type=int, default=50, help="services in the store")
+    parser.add_argument("--n", type=int, default=2_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    api.city_services.clear()
+    api.city_services.create_many([(f"service-{i}", "Utility" if i % 2 else "Parks") for i in range(args.size)])
+    client = api.app.test_client()
+
+    variables = {"type": "Parks"}
+    sha = hashlib.sha256(QUERY.encode()).hexdigest()
+    apq = {"persistedQuery": {"version": 1, "sha256Hash": sha}}
+    full = {"query": QUERY, "variables": variables}
+    hashed = {"extensions": apq, "variables": variables}
+
+    def post(payload):
+        resp = client.post("/api/v1/graphql", json=payload)
+        assert resp.status_code == 200 and "errors" not in resp.get_json(), resp.get_data()
+
+    def cold():
+        api.graphql_documents.clear()
+        post(full)
+
+    post({**full, "extensions": apq})  # register the hash
+    cases = [("cold (parse + validate)", cold), ("document cache", lambda: post(full)),
+             ("apq hash only", lambda: post(hashed))]
+
+    print(f"{'case':<26} {'us/request':>12}")
+    for label, fn in cases:
+        print(f"{label:<26} {per_call_us(fn, args.n):>12.1f}")
+
+    original = api.graphql_results
+    api.graphql_results = LRUCache(maxsize=256, ttl=60)
+    try:
+        print(f"{'result cache (apq)':<26} {per_call_us(lambda: post(hashed), args.n):>12.1f}")
+    finally:
+        api.graphql_results = original
+        api.city_services.clear()
+
+
+if __name__ == "__main__":
+    main()
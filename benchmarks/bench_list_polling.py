@@ -0,0 +1,56 @@
+# benchmarks/bench_list_polling.py
+# Purpose: Cost of polling GET /api/v1/city_services on an unchanged catalog:
+# old jsonify-everything path vs cached pages vs conditional 304s.
+#
+# Run:
+#   python -m benchmarks.bench_list_polling --size 10000
+
+import argparse
+import time
+
+from flask import jsonify
+
+from api import app, city_services
+
+
+def per_call_us(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="City services list polling benchmark")
+    parser.add_argument("--size", type=int, default=10_000)
+    parser.add_argument("--n", type=int, default=200)
+    args = parser.parse_args()
+
+    city_services.clear()
+    for i in range(args.size):
+        city_services.create(f"service-{i}", "Utility")
+
+    client = app.test_client()
+
+    with app.app_context():
+        old = per_call_us(lambda: jsonify(city_services.all()).get_data(), args.n)
+
+    first = client.get("/api/v1/city_services")
+    etag = first.headers["ETag"]
+    cached = per_call_us(lambda: client.get("/api/v1/city_services"), args.n)
+    not_modified = per_call_us(
+        lambda: client.get("/api/v1/city_services", headers={"If-None-Match": etag}), args.n
+    )
+    paged = per_call_us(lambda: client.get("/api/v1/city_services?limit=100"), args.n)
+
+    print(f"catalog size: {args.size}, body: {len(first.data):,} bytes")
+    print(f"{'old jsonify (handler only)':<30} {old:>10.0f} us")
+    print(f"{'GET 200, cached page':<30} {cached:>10.0f} us")
+    print(f"{'GET 304, If-None-Match':<30} {not_modified:>10.0f} us")
+    print(f"{'GET 200, limit=100':<30} {paged:>10.0f} us")
+
+    city_services.clear()
+
+
+if __name__ == "__main__":
+    main()
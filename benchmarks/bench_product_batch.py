@@ -0,0 +1,61 @@
+# benchmarks/bench_product_batch.py
+# Purpose: ProductService per-row CRUD (commit + refresh per call) vs the
+# single-transaction batch methods, on a real SQLite file.
+#
+# Run:
+#   python -m benchmarks.bench_product_batch --rows 5000
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base
+from app.models.product import Product, ProductCreate
+from app.services.product_service import ProductService
+
+
+def timed(label: str, rows: int, fn) -> None:
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {rows:>8,} rows {elapsed:>8.3f} s {rows / elapsed:>12,.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ProductService batch CRUD benchmark")
+    parser.add_argument("--rows", type=int, default=5000)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+        service = ProductService(db)
+        n = args.rows
+
+        created = []
+        timed("create (per row)", n, lambda: created.extend(
+            service.create(ProductCreate(name=f"p{i}")) for i in range(n)))
+        timed("update (per row)", n, lambda: [
+            service.update(p.id, ProductCreate(name=p.name + "x")) for p in created])
+        timed("delete (per row)", n, lambda: [service.delete(p.id) for p in created])
+
+        created = []
+        timed("create_many", n, lambda: created.extend(
+            service.create_many([ProductCreate(name=f"p{i}") for i in range(n)])))
+        timed("update_many", n, lambda: service.update_many(
+            [Product(id=p.id, name=p.name + "x") for p in created]))
+        timed("delete_many", n, lambda: service.delete_many([p.id for p in created]))
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# benchmarks/bench_products_serialization.py
+# Purpose: Cost of GET /products at 10k rows, old path vs fast path.
+#   old:  ORM objects -> Product models -> response_model validation -> JSONResponse
+#   new:  (id, name) tuples -> product_rows_to_json -> FastJSONResponse
+# Reports the serialization step alone and the full request in-process.
+#
+# Run:
+#   python -m benchmarks.bench_products_serialization --rows 10000
+
+import os
+
+# allow one page to hold the whole table for this comparison
+os.environ.setdefault("PRODUCTS_PAGE_MAX", "100000")
+
+import argparse
+import logging
+import tempfile
+import time
+from typing import List
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import TypeAdapter
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, ProductDB
+from app.models.product import Product
+from app.responses import product_rows_to_json
+
+
+def per_call_ms(fn, n: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="GET /products serialization benchmark")
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--n", type=int, default=20)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    from api_fastapi import app, product_cache
+    from app.db.deps import get_db, get_read_db
+    from app.services.product_service import ProductService
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                               connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(insert(ProductDB), [{"name": f"product-{i}"} for i in range(args.rows)])
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def override_get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        # ---- serialization step only ----
+        with SessionLocal() as db:
+            service = ProductService(db)
+            rows = service.get_page(args.rows)
+            products = [Product(id=r[0], name=r[1]) for r in rows]
+
+        adapter = TypeAdapter(List[Product])
+        # build models, re-validate them against List[Product], serialize (what response_model does)
+        old = per_call_ms(lambda: adapter.dump_json(adapter.validate_python(
+            [Product(id=r[0], name=r[1]) for r in rows])), args.n)
+        new = per_call_ms(lambda: product_rows_to_json(rows), args.n)
+        assert len(products) == args.rows
+
+        # ---- full request ----
+        legacy = FastAPI()
+
+        @legacy.get("/products", response_model=List[Product])
+        def legacy_products(db=Depends(override_get_db)):
+            return ProductService(db).get_all()  # the old ORM -> Product path
+
+        app.dependency_overrides[get_db] = override_get_db
+        app.dependency_overrides[get_read_db] = override_get_db
+        try:
+            with TestClient(legacy) as old_client, TestClient(app) as new_client:
+                url = f"/products?limit={args.rows}"
+                assert len(new_client.get(url).json()) == args.rows
+                old_req = per_call_ms(lambda: old_client.get("/products"), args.n)
+                if product_cache is not None:
+                    product_cache.clear()
+                    new_req = per_call_ms(lambda: (product_cache.clear(), new_client.get(url)), args.n)
+                else:
+                    new_req = per_call_ms(lambda: new_client.get(url), args.n)
+        finally:
+            app.dependency_overrides.clear()
+            engine.dispose()
+
+    print(f"rows: {args.rows}")
+    print(f"{'step':<34} {'old (ms)':>10} {'new (ms)':>10}")
+    print(f"{'serialize (models+validate vs rows)':<34} {old:>10.2f} {new:>10.2f}")
+    print(f"{'GET /products (uncached)':<34} {old_req:>10.2f} {new_req:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_service_etag.py
+# Purpose: Per-request timing for GET /api/v1/city_services/<name>,
+# old path (json.dumps + MD5 + jsonify on every call) vs the cached
+# encoded body/ETag kept on each store record.
+#
+# Two views:
+#   - handler: just the ETag + body work the route does
+#   - request: the full request through Flask's test client
+#
+# Run:
+#   python -m benchmarks.bench_service_etag
+
+import argparse
+import hashlib
+import json
+import time
+
+from flask import jsonify
+
+from api import app, city_services
+
+
+def make_etag(obj) -> str:
+    # The pre-cache implementation, kept here for comparison
+    raw = json.dumps(obj, sort_keys=True).encode("utf-8")
+    return '"' + hashlib.md5(raw).hexdigest() + '"'
+
+
+def old_handler(record, client_etag):
+    service = record.to_dict()
+    etag = make_etag(service)
+    if client_etag == etag:
+        return 304
+    jsonify(service).get_data()
+    return 200
+
+
+def new_handler(record, client_etag):
+    body, etag = record.encoded()
+    if client_etag == etag:
+        return 304
+    app.response_class(body, mimetype="application/json").get_data()
+    return 200
+
+
+def per_call_us(fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-service ETag/body cache benchmark")
+    parser.add_argument("--n", type=int, default=20_000)
+    args = parser.parse_args()
+
+    city_services.clear()
+    record = city_services.create("Water", "Utility")
+    _, etag = record.encoded()
+    old_etag = make_etag(record.to_dict())
+
+    print(f"{'case':<28} {'old (us)':>10} {'new (us)':>10}")
+    with app.app_context():
+        for label, client_etag_old, client_etag_new in (
+            ("handler 200", None, None),
+            ("handler 304", old_etag, etag),
+        ):
+            old = per_call_us(lambda: old_handler(record, client_etag_old), args.n)
+            new = per_call_us(lambda: new_handler(record, client_etag_new), args.n)
+            print(f"{label:<28} {old:>10.2f} {new:>10.2f}")
+
+    client = app.test_client()
+    n = max(args.n // 10, 1)
+    full = per_call_us(lambda: client.get("/api/v1/city_services/Water"), n)
+    cond = per_call_us(
+        lambda: client.get("/api/v1/city_services/Water", headers={"If-None-Match": etag}), n
+    )
+    print(f"{'request 200 (new)':<28} {'':>10} {full:>10.2f}")
+    print(f"{'request 304 (new)':<28} {'':>10} {cond:>10.2f}")
+
+    city_services.clear()
+
+
+if __name__ == "__main__":
+    main()
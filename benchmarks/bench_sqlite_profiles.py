@@ -0,0 +1,101 @@
+# benchmarks/bench_sqlite_profiles.py
+# Purpose: Concurrent read/write throughput on SQLite with the "default" vs
+# "production" engine profile (WAL + pragmas + separate read-only pool).
+# Writer threads insert+commit one product at a time; reader threads fetch
+# random products by id. Also counts "database is locked" errors.
+#
+# Run:
+#   python -m benchmarks.bench_sqlite_profiles
+#   python -m benchmarks.bench_sqlite_profiles --readers 8 --writers 2 --seconds 5
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base, ProductDB
+from app.db.session import build_engine
+
+
+def run(profile: str, readers: int, writers: int, seconds: float, seed_rows: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{os.path.join(tmp, 'bench.db')}"
+        production = profile == "production"
+        engine = build_engine(url, profile, pool_size=writers + 1 if production else None)
+        read_engine = (
+            build_engine(url, profile, read_only=True, pool_size=readers + 1)
+            if production else engine
+        )
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(insert(ProductDB), [{"name": f"seed-{i}"} for i in range(seed_rows)])
+
+        WriteSession = sessionmaker(bind=engine)
+        ReadSession = sessionmaker(bind=read_engine)
+        counts = {"reads": 0, "writes": 0, "locked": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def reader(seed):
+            rng = random.Random(seed)
+            n = 0
+            with ReadSession() as db:
+                while time.perf_counter() < deadline:
+                    db.execute(select(ProductDB.name).where(ProductDB.id == rng.randint(1, seed_rows))).first()
+                    db.rollback()  # end the read transaction, like a request would
+                    n += 1
+            with lock:
+                counts["reads"] += n
+
+        def writer(seed):
+            n = locked = 0
+            with WriteSession() as db:
+                while time.perf_counter() < deadline:
+                    try:
+                        db.execute(insert(ProductDB).values(name=f"w-{seed}-{n}"))
+                        db.commit()
+                        n += 1
+                    except OperationalError:
+                        db.rollback()
+                        locked += 1
+            with lock:
+                counts["writes"] += n
+                counts["locked"] += locked
+
+        threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+        threads += [threading.Thread(target=writer, args=(i,)) for i in range(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        if read_engine is not engine:
+            read_engine.dispose()
+        engine.dispose()
+
+    return {k: v / seconds if k != "locked" else v for k, v in counts.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="SQLite engine profile benchmark")
+    parser.add_argument("--profiles", nargs="+", default=["default", "production"])
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--seed-rows", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'profile':<12} {'reads/s':>10} {'writes/s':>10} {'locked errors':>14}")
+    for profile in args.profiles:
+        r = run(profile, args.readers, args.writers, args.seconds, args.seed_rows)
+        print(f"{profile:<12} {r['reads']:>10,.0f} {r['writes']:>10,.0f} {r['locked']:>14}")
+
+
+if __name__ == "__main__":
+    main()
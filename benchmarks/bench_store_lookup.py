@@ -0,0 +1,67 @@
+# benchmarks/bench_store_lookup.py
+# Purpose: Show that InMemoryServiceStore lookups stay flat as the store grows.
+#
+# Run:
+#   python -m benchmarks.bench_store_lookup
+#   python -m benchmarks.bench_store_lookup --sizes 1000 10000 --lookups 50000
+
+import argparse
+import random
+import time
+
+from app.store.memory import InMemoryServiceStore
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+
+def build_store(size: int) -> InMemoryServiceStore:
+    store = InMemoryServiceStore()
+    for i in range(size):
+        store.create(f"service-{i}", "Utility" if i % 2 else "Parks")
+    return store
+
+
+def time_lookups(fn, keys) -> float:
+    # Returns average nanoseconds per call
+    start = time.perf_counter_ns()
+    for k in keys:
+        fn(k)
+    return (time.perf_counter_ns() - start) / len(keys)
+
+
+def linear_scan(rows, service_id):
+    # What api.py used to do on every request
+    for s in rows:
+        if s["id"] == service_id:
+            return s
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="City services store lookup benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--scan-lookups", type=int, default=200,
+                        help="lookups for the old list scan (it is slow)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'size':>10} {'by id (ns)':>12} {'by name (ns)':>14} {'old scan (ns)':>15}")
+
+    for size in args.sizes:
+        store = build_store(size)
+        ids = [rng.randint(1, size) for _ in range(args.lookups)]
+        names = [f"service-{i - 1}" for i in ids]
+
+        by_id = time_lookups(store.get_by_id, ids)
+        by_name = time_lookups(store.get_by_name, names)
+
+        rows = store.all()
+        scan_ids = ids[: args.scan_lookups]
+        scan = time_lookups(lambda k: linear_scan(rows, k), scan_ids)
+
+        print(f"{size:>10} {by_id:>12.0f} {by_name:>14.0f} {scan:>15.0f}")
+
+
+if __name__ == "__main__":
+    main()
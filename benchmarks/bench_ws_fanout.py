@@ -0,0 +1,76 @@
+# benchmarks/bench_ws_fanout.py
+# Purpose: Show POST latency no longer depends on WebSocket subscriber count.
+#
+# For 1, 100 and 1000 fake clients it measures:
+#   - old inline loop: POST calls ws.send() for every client (each send
+#     costs --send-us microseconds, like a real socket write)
+#   - broadcaster: POST /api/v1/city_services with the same number of
+#     subscribers registered on api.broadcaster
+#
+# Run:
+#   python -m benchmarks.bench_ws_fanout
+
+import argparse
+import json
+import statistics
+import time
+
+from api import app, broadcaster, city_services
+
+
+class FakeSocket:
+    def __init__(self, send_us: float) -> None:
+        self._send_s = send_us / 1_000_000
+
+    def send(self, message: str) -> None:
+        # busy-wait: sleep() is too coarse for microseconds
+        end = time.perf_counter() + self._send_s
+        while time.perf_counter() < end:
+            pass
+
+
+def inline_post_us(clients: int, send_us: float, requests: int) -> float:
+    sockets = [FakeSocket(send_us) for _ in range(clients)]
+    samples = []
+    for i in range(requests):
+        start = time.perf_counter()
+        message = json.dumps({"event": "service.created", "data": {"id": i}})
+        for ws in sockets:
+            ws.send(message)
+        samples.append((time.perf_counter() - start) * 1e6)
+    return statistics.median(samples)
+
+
+def broadcaster_post_us(clients: int, requests: int) -> float:
+    client = app.test_client()
+    subs = [broadcaster.subscribe() for _ in range(clients)]
+    samples = []
+    try:
+        for i in range(requests):
+            start = time.perf_counter()
+            client.post("/api/v1/city_services", json={"name": f"svc-{i}", "type": "Utility"})
+            samples.append((time.perf_counter() - start) * 1e6)
+        broadcaster.flush(timeout=60)
+    finally:
+        for sub in subs:
+            broadcaster.unsubscribe(sub)
+        city_services.clear()
+    return statistics.median(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="WebSocket fan-out benchmark")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 100, 1000])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--send-us", type=float, default=20.0)
+    args = parser.parse_args()
+
+    print(f"{'clients':>8} {'old inline send (us)':>22} {'POST w/ broadcaster (us)':>26}")
+    for n in args.clients:
+        old = inline_post_us(n, args.send_us, min(args.requests, 50))
+        new = broadcaster_post_us(n, args.requests)
+        print(f"{n:>8} {old:>22.0f} {new:>26.0f}")
+
+
+if __name__ == "__main__":
+    main()
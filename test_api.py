@@ -120,3 +120,379 @@ def test_graphql_service_by_id():
     assert svc["id"] == service_id
     assert svc["name"] == "Water"
     assert svc["type"] == "Utility"
+
+
+def test_update_and_delete_service_by_id():
+    client = app.test_client()
+
+    created = client.post(
+        "/api/v1/city_services",
+        json={"name": "Water", "type": "Utility"}
+    ).get_json()
+    service_id = created["id"]
+
+    # rename: lookups by the new name work, the old name is gone
+    resp = client.put(f"/api/v1/city_services/{service_id}", json={"name": "Sewer"})
+    assert resp.status_code == 200
+    assert resp.get_json() == {"id": service_id, "name": "Sewer", "type": "Utility"}
+    assert client.get("/api/v1/city_services/Sewer").status_code == 200
+    assert client.get("/api/v1/city_services/Water").status_code == 404
+
+    resp = client.delete(f"/api/v1/city_services/{service_id}")
+    assert resp.status_code == 204
+    assert client.delete(f"/api/v1/city_services/{service_id}").status_code == 404
+    assert client.get("/api/v1/city_services").get_json() == []
+
+
+def test_write_events_are_broadcast():
+    from api import broadcaster
+
+    client = app.test_client()
+    sub = broadcaster.subscribe()
+    try:
+        created = client.post(
+            "/api/v1/city_services",
+            json={"name": "Water", "type": "Utility"}
+        ).get_json()
+        client.put(f"/api/v1/city_services/{created['id']}", json={"type": "Sewer"})
+        client.delete(f"/api/v1/city_services/{created['id']}")
+        assert broadcaster.flush(timeout=5)
+
+        events = [json.loads(sub.get(timeout=1)) for _ in range(3)]
+    finally:
+        broadcaster.unsubscribe(sub)
+
+    assert [e["event"] for e in events] == [
+        "service.created", "service.updated", "service.deleted"
+    ]
+    assert events[0]["data"] == created
+    assert events[1]["data"]["type"] == "Sewer"
+    assert events[2]["data"] == {"id": created["id"], "type": "Sewer"}
+
+
+def test_get_service_etag_changes_after_update():
+    client = app.test_client()
+
+    created = client.post(
+        "/api/v1/city_services",
+        json={"name": "Water", "type": "Utility"}
+    ).get_json()
+
+    resp1 = client.get("/api/v1/city_services/Water")
+    etag = resp1.headers["ETag"]
+    assert resp1.get_json() == created
+    assert resp1.content_type == "application/json"
+
+    client.put(f"/api/v1/city_services/{created['id']}", json={"type": "Sewer"})
+
+    # the cached body/ETag must not survive the PUT
+    resp2 = client.get("/api/v1/city_services/Water", headers={"If-None-Match": etag})
+    assert resp2.status_code == 200
+    assert resp2.headers["ETag"] != etag
+    assert resp2.get_json()["type"] == "Sewer"
+
+
+def test_list_services_etag_and_304():
+    client = app.test_client()
+    client.post("/api/v1/city_services", json={"name": "Water", "type": "Utility"})
+
+    resp1 = client.get("/api/v1/city_services")
+    etag = resp1.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    resp2 = client.get("/api/v1/city_services", headers={"If-None-Match": etag})
+    assert resp2.status_code == 304
+    assert not resp2.data
+
+    # any write changes the collection version
+    client.post("/api/v1/city_services", json={"name": "Parks", "type": "Recreation"})
+    resp3 = client.get("/api/v1/city_services", headers={"If-None-Match": etag})
+    assert resp3.status_code == 200
+    assert len(resp3.get_json()) == 2
+
+
+def test_list_services_pagination_and_type_filter():
+    client = app.test_client()
+    for i in range(5):
+        client.post(
+            "/api/v1/city_services",
+            json={"name": f"svc-{i}", "type": "Utility" if i % 2 == 0 else "Parks"}
+        )
+
+    resp = client.get("/api/v1/city_services?limit=2")
+    first = resp.get_json()
+    assert [s["name"] for s in first] == ["svc-0", "svc-1"]
+    cursor = resp.headers["X-Next-Cursor"]
+
+    resp = client.get(f"/api/v1/city_services?limit=2&cursor={cursor}")
+    assert [s["name"] for s in resp.get_json()] == ["svc-2", "svc-3"]
+
+    resp = client.get(f"/api/v1/city_services?limit=2&cursor={resp.headers['X-Next-Cursor']}")
+    assert [s["name"] for s in resp.get_json()] == ["svc-4"]
+    assert "X-Next-Cursor" not in resp.headers
+
+    resp = client.get("/api/v1/city_services?type=Utility")
+    assert [s["name"] for s in resp.get_json()] == ["svc-0", "svc-2", "svc-4"]
+
+    assert client.get("/api/v1/city_services?limit=0").status_code == 400
+    assert client.get("/api/v1/city_services?cursor=abc").status_code == 400
+
+
+def test_bulk_import_and_export_ndjson():
+    client = app.test_client()
+
+    body = b"\n".join([
+        b'{"name": "Water", "type": "Utility"}',
+        b'{"name": "Parks"}',
+        b'not json',
+        b'',
+        b'{"type": "Utility"}',
+        b'{"name": "Sewer", "type": "Utility"}',
+    ])
+    resp = client.post(
+        "/api/v1/city_services:bulk",
+        data=body,
+        content_type="application/x-ndjson"
+    )
+    assert resp.status_code == 200
+
+    report = resp.get_json()
+    assert report["created"] == 3
+    assert report["error_count"] == 2
+    assert [e["line"] for e in report["errors"]] == [3, 5]
+
+    resp = client.get("/api/v1/city_services:bulk")
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+
+    rows = [json.loads(line) for line in resp.data.splitlines()]
+    assert [r["name"] for r in rows] == ["Water", "Parks", "Sewer"]
+    assert rows[1]["type"] is None
+
+
+def test_api_with_sql_store(tmp_path, monkeypatch):
+    # Same endpoints on top of the SQLite store (SERVICE_STORE=sql)
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import api
+    from app.db.models import Base
+    from app.store.sql import SqlServiceStore
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'services.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    monkeypatch.setattr(api, "city_services", SqlServiceStore(sessionmaker(bind=engine)))
+    client = app.test_client()
+
+    created = client.post("/api/v1/city_services", json={"name": "Water", "type": "Utility"}).get_json()
+    assert client.get("/api/v1/city_services/Water").get_json() == created
+
+    resp = client.get("/api/v1/city_services")
+    assert resp.get_json() == [created]
+    assert client.get("/api/v1/city_services", headers={"If-None-Match": resp.headers["ETag"]}).status_code == 304
+
+    assert client.put(f"/api/v1/city_services/{created['id']}", json={"type": "Public"}).status_code == 200
+    body = client.post("/api/v1/graphql", json={"query": "{ services { name type } }"}).get_json()
+    assert body["data"]["services"] == [{"name": "Water", "type": "Public"}]
+
+    assert client.delete(f"/api/v1/city_services/{created['id']}").status_code == 204
+    assert client.get("/api/v1/city_services").get_json() == []
+
+
+def graphql(client, query, variables=None):
+    return client.post("/api/v1/graphql", json={"query": query, "variables": variables}).get_json()
+
+
+def test_graphql_aliased_service_lookups_are_batched(monkeypatch):
+    client = app.test_client()
+    ids = [city_services.create(f"s{i}", "Utility").id for i in range(20)]
+
+    calls = []
+    get_many = city_services.get_many
+    monkeypatch.setattr(city_services, "get_many", lambda service_ids: calls.append(1) or get_many(service_ids))
+
+    fields = " ".join(f"a{i}: service(id: {i}) {{ name }}" for i in ids + [99999])
+    body = graphql(client, "{ " + fields + " }")
+
+    assert len(calls) == 1
+    assert body["data"][f"a{ids[3]}"] == {"name": "s3"}
+    assert body["data"]["a99999"] is None
+
+
+def test_graphql_services_connection_pages_and_filters():
+    client = app.test_client()
+    for i in range(5):
+        client.post("/api/v1/city_services", json={"name": f"s{i}", "type": "even" if i % 2 == 0 else "odd"})
+
+    query = """
+    query($after: String) {
+      servicesConnection(first: 2, after: $after, type: "even") {
+        edges { cursor node { name } }
+        pageInfo { hasNextPage endCursor }
+      }
+    }
+    """
+    first = graphql(client, query)["data"]["servicesConnection"]
+    assert [e["node"]["name"] for e in first["edges"]] == ["s0", "s2"]
+    assert first["pageInfo"]["hasNextPage"] is True
+
+    second = graphql(client, query, {"after": first["pageInfo"]["endCursor"]})["data"]["servicesConnection"]
+    assert [e["node"]["name"] for e in second["edges"]] == ["s4"]
+    assert second["pageInfo"] == {"hasNextPage": False, "endCursor": second["edges"][0]["cursor"]}
+
+    assert [s["name"] for s in graphql(client, '{ services(type: "odd") { name } }')["data"]["services"]] == ["s1", "s3"]
+
+
+def test_graphql_rejects_expensive_queries():
+    client = app.test_client()
+
+    too_complex = "{ " + " ".join(f"a{i}: service(id: {i}) {{ id name type }}" for i in range(2000)) + " }"
+    body = graphql(client, too_complex)
+    assert body["data"] is None
+    assert "complexity" in body["errors"][0]["message"]
+
+    # page size counts towards the cost, so a huge `first` never reaches the resolver
+    body = graphql(client, "{ servicesConnection(first: 5000) { edges { node { id name type } } } }")
+    assert body["data"] is None
+    assert "complexity" in body["errors"][0]["message"]
+
+
+def test_graphql_persisted_queries():
+    import hashlib
+
+    client = app.test_client()
+    client.post("/api/v1/city_services", json={"name": "Water", "type": "Utility"})
+    query = "{ services { name } }"
+    sha = hashlib.sha256(query.encode()).hexdigest()
+    apq = {"persistedQuery": {"version": 1, "sha256Hash": sha}}
+
+    # unknown hash: the client retries with the full query
+    body = client.post("/api/v1/graphql", json={"extensions": apq}).get_json()
+    assert body["errors"][0]["message"] == "PersistedQueryNotFound"
+
+    body = client.post("/api/v1/graphql", json={"query": query, "extensions": apq}).get_json()
+    assert body["data"]["services"] == [{"name": "Water"}]
+
+    # from now on the hash alone is enough
+    body = client.post("/api/v1/graphql", json={"extensions": apq}).get_json()
+    assert body["data"]["services"] == [{"name": "Water"}]
+
+    wrong = {"persistedQuery": {"version": 1, "sha256Hash": "0" * 64}}
+    body = client.post("/api/v1/graphql", json={"query": query, "extensions": wrong}).get_json()
+    assert body["errors"][0]["extensions"]["code"] == "BAD_REQUEST"
+
+
+def test_graphql_repeated_query_is_parsed_once(monkeypatch):
+    import strawberry.schema.schema as strawberry_schema
+
+    client = app.test_client()
+    calls = []
+    parse = strawberry_schema.parse
+    monkeypatch.setattr(strawberry_schema, "parse", lambda *a, **kw: calls.append(1) or parse(*a, **kw))
+
+    query = "{ services { id name } servicesConnection(first: 3) { pageInfo { hasNextPage } } }"
+    for _ in range(3):
+        assert "errors" not in graphql(client, query)
+    assert len(calls) <= 1  # 0 if an earlier test already cached it
+
+    # invalid queries are cached with their errors too
+    bad = "{ nope }"
+    assert graphql(client, bad)["errors"] == graphql(client, bad)["errors"]
+
+
+def test_graphql_result_cache_tracks_store_version(monkeypatch):
+    import api
+    from app.cache.backends import LRUCache
+
+    monkeypatch.setattr(api, "graphql_results", LRUCache(maxsize=16, ttl=60))
+    client = app.test_client()
+    client.post("/api/v1/city_services", json={"name": "Water", "type": "Utility"})
+
+    calls = []
+    page = city_services.page
+    monkeypatch.setattr(city_services, "page", lambda *a, **kw: calls.append(1) or page(*a, **kw))
+
+    query = "query($t: String) { services(type: $t) { name } }"
+    for _ in range(3):
+        assert graphql(client, query, {"t": "Utility"})["data"]["services"] == [{"name": "Water"}]
+    assert len(calls) == 1
+
+    client.post("/api/v1/city_services", json={"name": "Parks", "type": "Utility"})
+    names = [s["name"] for s in graphql(client, query, {"t": "Utility"})["data"]["services"]]
+    assert names == ["Water", "Parks"]
+
+
+class FakeWebSocket:
+    # Just enough of flask-sock's socket for GraphQLTransportWSSession
+    def __init__(self):
+        import queue
+        self.inbox = queue.Queue()
+        self.outbox = queue.Queue()
+        self.close_code = None
+
+    def receive(self, timeout=None):
+        import queue
+        from simple_websocket import ConnectionClosed
+        try:
+            message = self.inbox.get(timeout=timeout)
+        except queue.Empty:
+            return None
+        if message is None:
+            raise ConnectionClosed()
+        return json.dumps(message)
+
+    def send(self, message):
+        self.outbox.put(json.loads(message))
+
+    def close(self, reason=None, message=None):
+        self.close_code = reason
+        self.inbox.put(None)
+
+    def next_message(self):
+        return self.outbox.get(timeout=5)
+
+
+def test_graphql_subscription_over_websocket():
+    import threading
+    import time
+
+    import api
+    from app.gql.ws import GraphQLTransportWSSession
+
+    client = app.test_client()
+    ws = FakeWebSocket()
+    before = api.broadcaster.subscriber_count
+    session = threading.Thread(
+        target=GraphQLTransportWSSession(ws, api.schema, api.graphql_ws_context).run, daemon=True
+    )
+    session.start()
+
+    ws.inbox.put({"type": "connection_init"})
+    assert ws.next_message() == {"type": "connection_ack"}
+
+    ws.inbox.put({"id": "1", "type": "subscribe", "payload": {
+        "query": 'subscription { serviceCreated(type: "Utility") { name type } }'}})
+    deadline = time.monotonic() + 5
+    while api.broadcaster.subscriber_count == before and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    client.post("/api/v1/city_services", json={"name": "Parks", "type": "Recreation"})  # filtered out
+    client.post("/api/v1/city_services", json={"name": "Water", "type": "Utility"})
+    assert ws.next_message() == {
+        "id": "1", "type": "next", "payload": {"data": {"serviceCreated": {"name": "Water", "type": "Utility"}}}
+    }
+
+    # queries work on the same socket
+    ws.inbox.put({"id": "2", "type": "subscribe", "payload": {"query": "{ services { name } }"}})
+    assert ws.next_message()["payload"]["data"]["services"] == [{"name": "Parks"}, {"name": "Water"}]
+    assert ws.next_message() == {"id": "2", "type": "complete"}
+
+    # client completes the subscription; the broadcaster forgets it
+    ws.inbox.put({"id": "1", "type": "complete"})
+    ws.inbox.put({"type": "ping"})
+    assert ws.next_message() == {"type": "pong"}
+    assert api.broadcaster.subscriber_count == before
+
+    ws.inbox.put(None)
+    session.join(timeout=5)
+    assert not session.is_alive()
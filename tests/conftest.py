@@ -15,9 +15,9 @@ from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
-from api_fastapi import app  # Your FastAPI app instance
+from api_fastapi import app, product_cache  # Your FastAPI app instance
 from app.db.models import Base
-from app.db.deps import get_db
+from app.db.deps import get_db, get_read_db
 
 
 @pytest.fixture(scope="function")
@@ -36,7 +36,7 @@ def client():
     Base.metadata.create_all(bind=engine)
 
     # Dependency override:
-    # Whenever FastAPI asks for get_db(), give it a Session from the test DB.
+    # Whenever FastAPI asks for get_db() or get_read_db(), give it a Session from the test DB.
     def override_get_db():
         db = TestingSessionLocal()
         try:
@@ -45,6 +45,11 @@ def client():
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    # Cached products from a previous test's DB must not leak into this one
+    if product_cache is not None:
+        product_cache.clear()
 
     # Create a test client (acts like a browser/Postman but in code)
     with TestClient(app) as c:
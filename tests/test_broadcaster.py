@@ -0,0 +1,81 @@
+# tests/test_broadcaster.py
+# Purpose:
+# Unit tests for the WebSocket event broadcaster (no sockets).
+
+import asyncio
+import json
+
+from app.events.broadcaster import Broadcaster, DISCONNECT, DROP_OLDEST
+
+
+def test_publish_reaches_every_subscriber():
+    b = Broadcaster()
+    subs = [b.subscribe() for _ in range(3)]
+    try:
+        b.publish("service.created", {"id": 1})
+        assert b.flush(timeout=5)
+
+        for sub in subs:
+            assert json.loads(sub.get(timeout=1)) == {
+                "event": "service.created", "data": {"id": 1}
+            }
+    finally:
+        b.stop()
+
+
+def test_slow_consumer_drop_oldest_keeps_latest():
+    b = Broadcaster(queue_size=2, policy=DROP_OLDEST)
+    sub = b.subscribe()
+    try:
+        for i in range(5):
+            b.publish("service.created", {"id": i})
+        assert b.flush(timeout=5)
+
+        got = [json.loads(sub.get(timeout=1))["data"]["id"] for _ in range(2)]
+        assert got == [3, 4]
+        assert sub.dropped == 3
+        assert not sub.closed
+    finally:
+        b.stop()
+
+
+def test_slow_consumer_disconnect_removes_client():
+    b = Broadcaster(queue_size=2, policy=DISCONNECT)
+    slow = b.subscribe()
+    try:
+        for i in range(3):
+            b.publish("service.created", {"id": i})
+        assert b.flush(timeout=5)
+
+        assert slow.closed
+        assert b.subscriber_count == 0
+    finally:
+        b.stop()
+
+
+def test_async_subscriber_gets_filtered_events_on_its_loop():
+    b = Broadcaster(queue_size=2, policy=DROP_OLDEST)
+
+    async def run():
+        sub = b.subscribe_async(events=["service.updated"])
+        raw = b.subscribe()
+        for i in range(4):
+            b.publish("service.created", {"id": i})
+            b.publish("service.updated", {"id": i})
+        await asyncio.get_running_loop().run_in_executor(None, b.flush, 5)
+        # let the scheduled deliveries run
+        await asyncio.sleep(0)
+
+        got = [await sub.get(), await sub.get()]
+        b.unsubscribe(sub)
+        assert await sub.get() is None
+        return got, sub.dropped, raw
+
+    try:
+        got, dropped, raw = asyncio.run(run())
+        assert got == [("service.updated", {"id": 2}), ("service.updated", {"id": 3})]
+        assert dropped == 2
+        # plain subscribers still get everything, as JSON
+        assert json.loads(raw.get(timeout=1))["event"] == "service.created"
+    finally:
+        b.stop()
@@ -0,0 +1,46 @@
+# tests/test_db_session.py
+# Purpose:
+# Tests for the SQLite tuning profiles in app/db/session.py.
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app.db.models import Base
+from app.db.session import build_engine
+
+
+def test_production_profile_applies_pragmas(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    engine = build_engine(url, "production", pool_size=2)
+    try:
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() > 0
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+    finally:
+        engine.dispose()
+
+
+def test_read_only_engine_rejects_writes(tmp_path):
+    url = f"sqlite:///{tmp_path / 'profile.db'}"
+    engine = build_engine(url, "production")
+    read_engine = build_engine(url, "production", read_only=True)
+    try:
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(text("INSERT INTO products (name) VALUES ('Mango')"))
+
+        with read_engine.connect() as conn:
+            assert conn.execute(text("SELECT name FROM products")).scalar() == "Mango"
+            with pytest.raises(OperationalError):
+                conn.execute(text("INSERT INTO products (name) VALUES ('Apple')"))
+    finally:
+        read_engine.dispose()
+        engine.dispose()
+
+
+def test_unknown_profile_is_rejected():
+    with pytest.raises(ValueError):
+        build_engine("sqlite://", "turbo")
@@ -0,0 +1,85 @@
+# tests/test_product_cache.py
+# Purpose:
+# Tests for the product read-through cache (backends, stampede guard,
+# invalidation through the API).
+
+import threading
+import time
+
+from app.cache.backends import MISSING, LRUCache
+from app.cache.read_through import ReadThroughCache
+
+
+def test_lru_cache_evicts_and_expires():
+    cache = LRUCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")          # "b" is now least recently used
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING
+    assert cache.get("a") == 1
+
+    time.sleep(0.06)
+    assert cache.get("a") is MISSING
+
+
+def test_concurrent_misses_cause_one_load():
+    cache = ReadThroughCache(LRUCache())
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(timeout=5)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_load("k", loader)))
+        for _ in range(10)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+
+    assert results == ["value"] * 10
+    assert len(calls) == 1
+    assert cache.stats()["loads"] == 1
+    assert cache.get_or_load("k", loader) == "value"
+    assert cache.stats()["hits"] == 1
+
+
+def test_load_racing_an_invalidation_is_not_cached():
+    cache = ReadThroughCache(LRUCache())
+
+    def loader():
+        cache.invalidate("k")   # a write lands while we were reading
+        return "stale"
+
+    assert cache.get_or_load("k", loader) == "stale"
+    assert cache.backend.get("k") is MISSING
+
+
+def test_api_reads_are_cached_and_writes_invalidate(client):
+    from api_fastapi import product_cache
+
+    pid = client.post("/products", json={"name": "Mango"}).json()["id"]
+
+    assert client.get(f"/products/{pid}").json()["name"] == "Mango"
+    before = client.get("/cache/stats").json()
+    assert client.get(f"/products/{pid}").json()["name"] == "Mango"
+    after = client.get("/cache/stats").json()
+    assert after["hits"] == before["hits"] + 1
+
+    client.put(f"/products/{pid}", json={"name": "Mango Updated"})
+    assert client.get(f"/products/{pid}").json()["name"] == "Mango Updated"
+    assert [p["name"] for p in client.get("/products").json()] == ["Mango Updated"]
+
+    client.delete(f"/products/{pid}")
+    assert client.get(f"/products/{pid}").status_code == 404
+    assert client.get("/products").json() == []
+    assert product_cache is not None
@@ -8,7 +8,7 @@ from sqlalchemy.orm import sessionmaker
 
 from app.db.models import Base
 from app.services.product_service import ProductService
-from app.models.product import ProductCreate
+from app.models.product import Product, ProductCreate
 
 
 def test_service_create_and_get_all():
@@ -33,3 +33,29 @@ def test_service_create_and_get_all():
     finally:
         db.close()
         Base.metadata.drop_all(bind=engine)
+
+
+def test_service_batch_methods_single_transaction():
+    engine = create_engine("sqlite:///./test_service.db", connect_args={"check_same_thread": False})
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    try:
+        service = ProductService(db)
+
+        created = service.create_many([ProductCreate(name=f"Batch {i}") for i in range(2500)])
+        assert len(created) == 2500
+        assert [p.name for p in created[:2]] == ["Batch 0", "Batch 1"]
+
+        # spans several UPDATE/DELETE chunks
+        renamed = service.update_many([Product(id=p.id, name=p.name + "!") for p in created])
+        assert all(p.name.endswith("!") for p in renamed)
+        assert service.get_by_id(created[-1].id).name == "Batch 2499!"
+
+        deleted = service.delete_many([p.id for p in created[:2000]])
+        assert len(deleted) == 2000
+        assert len(service.get_all()) == 500
+    finally:
+        db.close()
+        Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,83 @@
+# tests/test_products_async.py
+# Purpose:
+# Tests for the async data path (DB_MODE=async): AsyncProductService and
+# the async def routes, against an isolated aiosqlite test DB.
+
+import asyncio
+import os
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.db.deps import get_async_db
+from app.db.models import Base
+from app.models.product import ProductCreate
+from app.routers.products_async import router
+from app.services.async_product_service import AsyncProductService
+
+pytest.importorskip("aiosqlite")
+
+TEST_DB_FILE = "./test_async_city_services.db"
+
+
+@pytest.fixture(scope="function")
+def session_factory():
+    engine = create_async_engine(f"sqlite+aiosqlite:///{TEST_DB_FILE}")
+
+    async def create():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create())
+    yield async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+    asyncio.run(engine.dispose())
+    try:
+        os.remove(TEST_DB_FILE)
+    except OSError:
+        pass
+
+
+def test_async_service_crud(session_factory):
+    async def scenario():
+        async with session_factory() as db:
+            service = AsyncProductService(db)
+
+            created = await service.create(ProductCreate(name="Async Mango"))
+            assert created.id > 0
+
+            updated = await service.update(created.id, ProductCreate(name="Async Apple"))
+            assert updated.name == "Async Apple"
+            assert await service.update(9999, ProductCreate(name="Nope")) is None
+
+            assert [p.name for p in await service.get_all()] == ["Async Apple"]
+
+            assert await service.delete(created.id) is True
+            assert await service.delete(created.id) is False
+            assert await service.get_by_id(created.id) is None
+
+    asyncio.run(scenario())
+
+
+def test_async_routes(session_factory):
+    app = FastAPI()
+    app.include_router(router)
+
+    async def override_get_async_db():
+        async with session_factory() as db:
+            yield db
+
+    app.dependency_overrides[get_async_db] = override_get_async_db
+
+    with TestClient(app) as client:
+        res = client.post("/products", json={"name": "Mango"})
+        assert res.status_code == 201
+        pid = res.json()["id"]
+
+        assert client.get(f"/products/{pid}").json() == {"id": pid, "name": "Mango"}
+        assert client.put(f"/products/{pid}", json={"name": "Kiwi"}).json()["name"] == "Kiwi"
+        assert client.delete(f"/products/{pid}").status_code == 200
+        assert client.get(f"/products/{pid}").status_code == 404
+        assert client.post("/products", json={"name": "A"}).status_code == 422
@@ -0,0 +1,43 @@
+# tests/test_products_batch.py
+# Purpose:
+# API tests for the single-transaction batch routes on /products:batch.
+
+def test_batch_create_returns_ids_in_order(client):
+    res = client.post("/products:batch", json=[{"name": "Mango"}, {"name": "Apple"}, {"name": "Kiwi"}])
+    assert res.status_code == 201
+
+    body = res.json()
+    assert [p["name"] for p in body] == ["Mango", "Apple", "Kiwi"]
+    assert body[0]["id"] < body[1]["id"] < body[2]["id"]
+
+
+def test_batch_update_skips_missing_ids(client):
+    created = client.post("/products:batch", json=[{"name": "Mango"}, {"name": "Apple"}]).json()
+
+    res = client.put("/products:batch", json=[
+        {"id": created[0]["id"], "name": "Mango 2"},
+        {"id": 9999, "name": "Nope"},
+        {"id": created[1]["id"], "name": "Apple 2"},
+    ])
+    assert res.status_code == 200
+    assert res.json() == [
+        {"id": created[0]["id"], "name": "Mango 2"},
+        {"id": created[1]["id"], "name": "Apple 2"},
+    ]
+    assert client.get(f"/products/{created[1]['id']}").json()["name"] == "Apple 2"
+
+
+def test_batch_delete_returns_deleted_ids(client):
+    created = client.post("/products:batch", json=[{"name": "Mango"}, {"name": "Apple"}]).json()
+    ids = [p["id"] for p in created]
+
+    res = client.request("DELETE", "/products:batch", json=ids + [9999])
+    assert res.status_code == 200
+    assert res.json() == {"deleted": ids}
+    assert client.get("/products").json() == []
+
+
+def test_batch_validation_errors_return_422(client):
+    res = client.post("/products:batch", json=[{"name": "Mango"}, {"name": "A"}])
+    assert res.status_code == 422
+    assert client.get("/products").json() == []
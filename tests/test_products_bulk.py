@@ -0,0 +1,41 @@
+# tests/test_products_bulk.py
+# Purpose:
+# API tests for NDJSON bulk import/export on /products:bulk.
+
+import json
+
+
+def test_bulk_import_reports_bad_lines(client):
+    body = "\n".join([
+        '{"name": "Mango"}',
+        '{"name": "A"}',          # too short (min_length=2)
+        '[1, 2]',                 # not an object
+        '{"name": "Apple"}',
+    ])
+    res = client.post(
+        "/products:bulk",
+        content=body,
+        headers={"Content-Type": "application/x-ndjson"}
+    )
+    assert res.status_code == 200
+
+    report = res.json()
+    assert report["created"] == 2
+    assert report["error_count"] == 2
+    assert [e["line"] for e in report["errors"]] == [2, 3]
+
+    names = [p["name"] for p in client.get("/products").json()]
+    assert names == ["Mango", "Apple"]
+
+
+def test_bulk_export_streams_ndjson(client):
+    for name in ("Mango", "Apple", "Kiwi"):
+        client.post("/products", json={"name": name})
+
+    res = client.get("/products:bulk")
+    assert res.status_code == 200
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert [r["name"] for r in rows] == ["Mango", "Apple", "Kiwi"]
+    assert all("id" in r for r in rows)
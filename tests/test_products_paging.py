@@ -0,0 +1,77 @@
+# tests/test_products_paging.py
+# Purpose:
+# API tests for keyset pagination, filtering, sorting and streaming on GET /products.
+
+from urllib.parse import parse_qs, urlsplit
+
+
+NAMES = ["Pear", "Apple", "Plum", "Apricot", "Kiwi", "Peach"]
+
+
+def seed(client):
+    return client.post("/products:batch", json=[{"name": n} for n in NAMES]).json()
+
+
+def follow_pages(client, url):
+    # Walk the Link: rel="next" chain, collecting names
+    names = []
+    while url:
+        res = client.get(url)
+        assert res.status_code == 200
+        names += [p["name"] for p in res.json()]
+        link = res.headers.get("link")
+        url = None
+        if link:
+            next_url = link.split(";")[0].strip("<>")
+            parts = urlsplit(next_url)
+            url = f"{parts.path}?{parts.query}"
+    return names
+
+
+def test_id_keyset_pages(client):
+    created = seed(client)
+
+    res = client.get("/products?limit=4")
+    assert [p["name"] for p in res.json()] == NAMES[:4]
+    assert res.headers["x-next-after-id"] == str(created[3]["id"])
+
+    res = client.get(f"/products?limit=4&after_id={created[3]['id']}")
+    assert [p["name"] for p in res.json()] == NAMES[4:]
+    assert "link" not in res.headers
+
+    assert follow_pages(client, "/products?limit=2&sort=-id") == NAMES[::-1]
+
+
+def test_name_sort_and_prefix_filter(client):
+    seed(client)
+
+    assert follow_pages(client, "/products?limit=2&sort=name") == sorted(NAMES)
+    assert follow_pages(client, "/products?limit=2&sort=-name") == sorted(NAMES, reverse=True)
+    assert follow_pages(client, "/products?limit=1&sort=name&name_prefix=P") == ["Peach", "Pear", "Plum"]
+    assert [p["name"] for p in client.get("/products?name_prefix=Ap").json()] == ["Apple", "Apricot"]
+
+
+def test_link_header_keeps_filters(client):
+    seed(client)
+
+    res = client.get("/products?limit=1&sort=name&name_prefix=P")
+    query = parse_qs(urlsplit(res.headers["link"].split(";")[0].strip("<>")).query)
+    assert query["name_prefix"] == ["P"]
+    assert query["after_name"] == ["Peach"]
+
+
+def test_bad_cursor_and_limits(client):
+    assert client.get("/products?sort=name&after_id=3").status_code == 400
+    assert client.get("/products?after_name=Pear").status_code == 400
+    assert client.get("/products?limit=0").status_code == 422
+    assert client.get("/products?limit=100000").status_code == 422
+
+
+def test_stream_returns_full_json_array(client):
+    seed(client)
+
+    res = client.get("/products?stream=true")
+    assert res.status_code == 200
+    assert [p["name"] for p in res.json()] == NAMES
+
+    assert [p["name"] for p in client.get("/products?stream=true&name_prefix=K").json()] == ["Kiwi"]
@@ -0,0 +1,121 @@
+# tests/test_service_store.py
+# Purpose:
+# Unit tests for the in-memory city services store used by api.py (no HTTP).
+
+import json
+import threading
+
+from app.store.memory import InMemoryServiceStore
+
+
+def test_store_create_and_lookup():
+    store = InMemoryServiceStore()
+
+    water = store.create("Water", "Utility")
+    parks = store.create("Parks", None)
+
+    assert store.get_by_id(water.id) is water
+    assert store.get_by_name("Parks") is parks
+    assert store.get_by_name("Missing") is None
+    assert store.all() == [
+        {"id": water.id, "name": "Water", "type": "Utility"},
+        {"id": parks.id, "name": "Parks", "type": None},
+    ]
+
+
+def test_store_duplicate_names_return_oldest():
+    store = InMemoryServiceStore()
+
+    first = store.create("Water", "Utility")
+    second = store.create("Sewer", "Utility")
+
+    # rename the newer record onto an existing name: the oldest still wins
+    store.update(second.id, {"name": "Water"})
+    assert store.get_by_name("Water") is first
+
+    store.delete(first.id)
+    assert store.get_by_name("Water").id == second.id
+    assert store.get_by_name("Sewer") is None
+
+
+def test_store_delete_keeps_indexes_consistent():
+    store = InMemoryServiceStore()
+
+    record = store.create("Water", "Utility")
+    assert store.delete(record.id) is True
+    assert store.delete(record.id) is False
+
+    assert len(store) == 0
+    assert store.get_by_id(record.id) is None
+    assert store.get_by_name("Water") is None
+
+
+def test_store_concurrent_creates_get_unique_ids():
+    store = InMemoryServiceStore()
+    per_thread = 500
+
+    def worker(n):
+        for i in range(per_thread):
+            store.create(f"svc-{n}-{i}", None)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ids = [s["id"] for s in store.all()]
+    assert len(ids) == 8 * per_thread
+    assert len(set(ids)) == len(ids)
+
+
+def test_store_snapshot_is_stable_while_deleting():
+    store = InMemoryServiceStore()
+    for i in range(2000):
+        store.create(f"svc-{i}", None)
+
+    errors = []
+
+    def reader():
+        try:
+            for _ in range(50):
+                rows = store.all()
+                assert all(r["name"] == f"svc-{r['id'] - 1}" for r in rows)
+        except Exception as e:  # pragma: no cover - only on failure
+            errors.append(e)
+
+    t = threading.Thread(target=reader)
+    t.start()
+    for i in range(1, 2001, 2):
+        store.delete(i)
+    t.join()
+
+    assert errors == []
+    assert len(store) == 1000
+
+
+def test_store_encoded_page_is_cached_per_version():
+    store = InMemoryServiceStore()
+    store.create("Water", "Utility")
+
+    page1 = store.encoded_page()
+    assert store.encoded_page() is page1
+    assert json.loads(page1.body) == store.all()
+
+    store.create("Parks", None)
+    page2 = store.encoded_page()
+    assert page2 is not page1
+    assert page2.version > page1.version
+    assert page2.etag != page1.etag
+
+
+def test_store_page_skips_deleted_ids_after_compaction():
+    store = InMemoryServiceStore()
+    for i in range(3000):
+        store.create(f"svc-{i}", None)
+    for i in range(1, 2901):
+        store.delete(i)
+
+    records, cursor = store.page(cursor=0, limit=50)
+    assert [r.id for r in records] == list(range(2901, 2951))
+    assert cursor == 2950
@@ -0,0 +1,77 @@
+# tests/test_sql_service_store.py
+# Purpose:
+# Unit tests for the SQLite-backed city services store (SERVICE_STORE=sql).
+# Each test gets its own database file.
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.models import Base
+from app.store.sql import SqlServiceStore
+
+
+def make_store(tmp_path, name="services.db"):
+    engine = create_engine(f"sqlite:///{tmp_path / name}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    return SqlServiceStore(sessionmaker(bind=engine, autoflush=False))
+
+
+def test_sql_store_crud(tmp_path):
+    store = make_store(tmp_path)
+
+    water = store.create("Water", "Utility")
+    parks = store.create("Parks", None)
+    assert len(store) == 2
+
+    assert store.get_by_id(water.id).to_dict() == {"id": water.id, "name": "Water", "type": "Utility"}
+    assert store.get_by_name("Parks").id == parks.id
+    assert store.get_by_name("Missing") is None
+
+    updated = store.update(water.id, {"type": "Public"})
+    assert updated.to_dict() == {"id": water.id, "name": "Water", "type": "Public"}
+    assert updated.version == 2
+    assert store.update(9999, {"name": "x"}) is None
+
+    assert store.delete(parks.id) is True
+    assert store.delete(parks.id) is False
+    assert store.all() == [{"id": water.id, "name": "Water", "type": "Public"}]
+
+    # ids are not reused after a delete
+    assert store.create("Roads", None).id > parks.id
+
+
+def test_sql_store_pages_and_version(tmp_path):
+    store = make_store(tmp_path)
+    records = store.create_many([(f"s{i}", "even" if i % 2 == 0 else "odd") for i in range(5)])
+    assert [r.name for r in records] == ["s0", "s1", "s2", "s3", "s4"]
+
+    page, cursor = store.page(0, 2)
+    assert [r.name for r in page] == ["s0", "s1"]
+    page, cursor = store.page(cursor, 2)
+    assert [r.name for r in page] == ["s2", "s3"]
+    page, cursor = store.page(cursor, 2)
+    assert [r.name for r in page] == ["s4"] and cursor is None
+
+    evens, _ = store.page(type="even")
+    assert [r.name for r in evens] == ["s0", "s2", "s4"]
+
+    first = store.encoded_page(0, 2)
+    assert store.encoded_page(0, 2) is first  # unchanged version: served from cache
+    store.update(records[0].id, {"name": "renamed"})
+    second = store.encoded_page(0, 2)
+    assert second.version == first.version + 1
+    assert second.etag != first.etag
+    assert b"renamed" in second.body
+
+
+def test_sql_store_shared_between_instances(tmp_path):
+    # Two stores on one file stand in for two workers
+    a = make_store(tmp_path)
+    b = make_store(tmp_path)
+
+    etag = b.etag
+    a.create("Water", "Utility")
+
+    assert b.get_by_name("Water") is not None
+    assert b.etag != etag
+    assert a.etag == b.etag